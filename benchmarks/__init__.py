@@ -0,0 +1 @@
+"""Micro-benchmarks for the fly_python_sdk models."""
@@ -0,0 +1,136 @@
+"""
+Micro-benchmarks for parsing and dumping the Fly machine models.
+
+Run from the repository root:
+
+    python -m benchmarks.models            # compare against benchmarks/baseline.json
+    python -m benchmarks.models --update   # record a new baseline
+
+Each case reports the best per-call time over several repeats. Times are
+divided by the time of a fixed calibration workload run in the same process,
+so the stored baseline is in host-independent units rather than seconds. The
+run fails if any case is slower than its baseline by more than --threshold.
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+from typing import Callable
+
+from pydantic import TypeAdapter
+
+from benchmarks import payloads
+from fly_python_sdk.models.machine import FlyMachine, FlyMachineConfig, FlyMachineEvent
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+DEFAULT_THRESHOLD = 1.25
+DEFAULT_REPEAT = 5
+
+MachineList = TypeAdapter(list[FlyMachine])
+EventList = TypeAdapter(list[FlyMachineEvent])
+
+
+def _cases() -> dict[str, Callable[[], object]]:
+    config = payloads.machine_config(0)
+    machine = payloads.machine(0)
+    parsed_machine = FlyMachine(**machine)
+    events = payloads.events(1_000)
+
+    cases = {
+        "config_validate": lambda: FlyMachineConfig(**config),
+        "machine_validate": lambda: FlyMachine(**machine),
+        "machine_dump_exclude_none": lambda: parsed_machine.model_dump(
+            exclude_none=True
+        ),
+        "machine_dump_json_exclude_none": lambda: parsed_machine.model_dump_json(
+            exclude_none=True
+        ),
+        "events_1000_list_parse": lambda: [FlyMachineEvent(**event) for event in events],
+        "events_1000_adapter_parse": lambda: EventList.validate_python(events),
+    }
+
+    for count in (1, 100, 1_000, 10_000):
+        machines = payloads.machines(count)
+        machines_json = json.dumps(machines).encode()
+        cases[f"machines_{count}_list_parse"] = lambda machines=machines: [
+            FlyMachine(**machine) for machine in machines
+        ]
+        cases[f"machines_{count}_adapter_parse_json"] = (
+            lambda machines_json=machines_json: MachineList.validate_json(machines_json)
+        )
+
+    return cases
+
+
+def _calibration() -> None:
+    """A fixed pure-Python workload used as the unit of time for every case."""
+    machine = payloads.machine(0)
+    for _ in range(20):
+        json.loads(json.dumps(machine))
+
+
+def _time(function: Callable[[], object], repeat: int) -> float:
+    """Returns the best per-call time of `function` in seconds."""
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--update", action="store_true", help="Write a new baseline.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("-k", dest="keyword", help="Only run cases containing this.")
+    args = parser.parse_args(argv)
+
+    baseline = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+    results = {}
+    regressions = []
+
+    # Calibrate before and after the cases and keep the faster run, so a noisy
+    # moment during calibration doesn't skew every ratio.
+    calibration = _time(_calibration, args.repeat)
+    cases = _cases()
+    timings = {}
+
+    for name, function in cases.items():
+        if args.keyword and args.keyword not in name:
+            continue
+        timings[name] = _time(function, args.repeat)
+
+    calibration = min(calibration, _time(_calibration, args.repeat))
+    print(f"{'calibration':<40} {calibration * 1e6:>12.1f} us")
+
+    for name, seconds in timings.items():
+        results[name] = seconds / calibration
+        line = f"{name:<40} {seconds * 1e6:>12.1f} us {results[name]:>10.3f} units"
+
+        if name in baseline:
+            ratio = results[name] / baseline[name]
+            line += f"  {ratio:>5.2f}x baseline"
+            if ratio > args.threshold:
+                regressions.append(name)
+                line += "  REGRESSION"
+
+        print(line)
+
+    if args.update:
+        BASELINE_PATH.write_text(json.dumps({**baseline, **results}, indent=2) + "\n")
+        print(f"Wrote {BASELINE_PATH}.")
+        return 0
+
+    if regressions:
+        print(
+            f"{len(regressions)} case(s) regressed by more than {args.threshold}x: "
+            + ", ".join(regressions)
+        )
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""Synthetic Fly Machines API payloads shaped like real responses."""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+from fly_python_sdk import FLY_MACHINE_STATES, FLY_MACHINE_VM_SIZES, FLY_REGIONS
+
+EVENT_TYPES = [
+    ("launch", "created"),
+    ("start", "started"),
+    ("exit", "stopped"),
+    ("update", "replacing"),
+]
+
+
+def machine_config(index: int) -> dict:
+    """Returns a full machine config with env, guest, processes, mounts and checks."""
+    return {
+        "image": f"registry.fly.io/fly-away:deployment-{index:08x}",
+        "env": {f"ENV_VAR_{i}": f"value-{index}-{i}" for i in range(12)},
+        "init": {"exec": None, "entrypoint": None, "cmd": None, "tty": False},
+        "metadata": {
+            "fly_platform_version": "v2",
+            "fly_process_group": "app",
+            "fly_release_id": f"release-{index % 50}",
+            "fly_release_version": str(index % 50),
+        },
+        "restart": {"policy": "on-failure"},
+        "guest": {
+            "cpu_kind": "shared",
+            "cpus": 1 + index % 4,
+            "memory_mb": 256 * (1 + index % 8),
+            "kernel_args": ["quiet"],
+        },
+        "auto_destroy": False,
+        "size": FLY_MACHINE_VM_SIZES[index % len(FLY_MACHINE_VM_SIZES)],
+        "ports": [
+            {"port": 80, "handlers": ["http"]},
+            {"port": 443, "handlers": ["tls", "http"]},
+        ],
+        "processes": [
+            {
+                "name": name,
+                "entrypoint": ["/bin/sh", "-c"],
+                "cmd": [f"bin/{name}", "--port", "8080"],
+                "env": {"PROCESS": name},
+                "user": "app",
+            }
+            for name in ("web", "worker", "scheduler")
+        ],
+        "mounts": {"volume": f"vol_{index:016x}", "path": "/data"},
+        "metrics": {"port": 9091, "path": "/metrics"},
+        "checks": {
+            "http": {
+                "type": "http",
+                "port": 8080,
+                "interval": "15s",
+                "timeout": "2s",
+                "method": "GET",
+                "path": "/healthz",
+                "headers": {"Host": "fly-away.fly.dev"},
+            },
+            "tcp": {"type": "tcp", "port": 8080, "interval": "15s", "timeout": "2s"},
+        },
+    }
+
+
+def machine(index: int) -> dict:
+    """Returns a machine as returned by the list and inspect endpoints."""
+    created_at = datetime(2023, 7, 1, tzinfo=timezone.utc) + timedelta(minutes=index)
+    return {
+        "id": f"{index:014x}",
+        "name": f"fly-away-{index}",
+        "state": FLY_MACHINE_STATES[index % len(FLY_MACHINE_STATES)],
+        "region": FLY_REGIONS[index % len(FLY_REGIONS)],
+        "instance_id": f"01H{index:023d}",
+        "private_ip": f"fdaa:0:1:a7b:{index % 0xFFFF:x}::2",
+        "config": machine_config(index),
+        "image_ref": {
+            "registry": "registry.fly.io",
+            "repository": "fly-away",
+            "tag": f"deployment-{index:08x}",
+            "digest": f"sha256:{index:064x}",
+            "labels": {"org.opencontainers.image.source": "github.com/fly/fly-away"},
+        },
+        "checks": [
+            {"name": "http", "status": "passing", "output": "200 OK"},
+            {"name": "tcp", "status": "passing", "output": "Success"},
+        ],
+        "created_at": created_at.isoformat(),
+        "updated_at": (created_at + timedelta(seconds=30)).isoformat(),
+    }
+
+
+def machines(count: int) -> list[dict]:
+    return [machine(index) for index in range(count)]
+
+
+def events(count: int, seed: int = 0) -> list[dict]:
+    """Returns a machine event history, newest first like the events endpoint."""
+    rng = random.Random(seed)
+    started_at = datetime(2023, 7, 1, tzinfo=timezone.utc)
+    history = []
+
+    for index in range(count):
+        event_type, status = EVENT_TYPES[index % len(EVENT_TYPES)]
+        event = {
+            "id": f"01H{index:023d}",
+            "source": rng.choice(["user", "flyd"]),
+            "status": status,
+            "timestamp": int(
+                (started_at + timedelta(seconds=index * 7)).timestamp() * 1000
+            ),
+            "type": event_type,
+        }
+        if event_type == "exit":
+            event["request"] = {
+                "exit_event": {"exit_code": 0, "oom_killed": False},
+                "restart_count": index // len(EVENT_TYPES),
+            }
+        history.append(event)
+
+    return list(reversed(history))
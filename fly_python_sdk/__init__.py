@@ -3,12 +3,16 @@
 __version__ = "0.1"
 
 DEFAULT_API_TIMEOUT = 60
+DEFAULT_API_CONCURRENCY = 10
 
 FLY_MACHINE_DEFAULT_CPU_COUNT = 1
 FLY_MACHINE_DEFAULT_MEMORY_MB = 256
 FLY_MACHINE_DEFAULT_WAIT_TIMEOUT = 60
+FLY_MACHINE_DEFAULT_EXEC_TIMEOUT = 30
 
 FLY_MACHINES_API_DEFAULT_API_HOSTNAME = "https://api.machines.dev"
+FLY_MACHINES_API_INTERNAL_API_HOSTNAME = "http://_api.internal:4280"
+FLY_MACHINES_API_ENDPOINT_PROBE_INTERVAL = 300
 FLY_MACHINES_API_VERSION = 1
 
 FLY_MACHINE_STATES = [
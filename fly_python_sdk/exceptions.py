@@ -60,3 +60,11 @@ class MachineInvalidStateError(Exception):
 
     def __str__(self):
         return self.message
+
+
+class MachineNotReadyError(Exception):
+    def __init__(self, message):
+        self.message = message
+
+    def __str__(self):
+        return self.message
@@ -6,8 +6,9 @@ class Fly(FlyApi):
     def __init__(
         self,
         api_token: str,
+        **api_options,
     ):
-        super().__init__(api_token)
+        super().__init__(api_token, **api_options)
 
     def Org(
         self,
@@ -16,4 +17,5 @@ class Fly(FlyApi):
         return Org(
             api_token=self.api_token,
             org_slug=org_slug,
+            **self._api_options(),
         )
@@ -1,15 +1,50 @@
+from contextlib import nullcontext
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING
+
 import httpx
 
 from fly_python_sdk import (
     DEFAULT_API_TIMEOUT,
-    FLY_MACHINES_API_DEFAULT_API_HOSTNAME,
     FLY_MACHINES_API_VERSION,
 )
+from fly_python_sdk.fly.endpoint import EndpointSelector
+from fly_python_sdk.fly.hedge import HedgePolicy, _route
+
+if TYPE_CHECKING:
+    from fly_python_sdk.fly.manager import RateLimiter
+
+DEFAULT_RETRY_AFTER = 1.0
+
+
+def _parse_retry_after(value: str | None) -> float:
+    """Returns the seconds to wait from a Retry-After header (seconds or an HTTP date)."""
+    if value is None:
+        return DEFAULT_RETRY_AFTER
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return DEFAULT_RETRY_AFTER
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
 
 
 class FlyApi:
     """
     A class for interacting with the Fly Machines API (docs.machines.dev).
+
+    If base_url is not set, requests go to the endpoint chosen by endpoint_selector,
+    which prefers the internal API when running on Fly.
     """
 
     def __init__(
@@ -17,56 +52,163 @@ class FlyApi:
         api_token,
         api_timeout=DEFAULT_API_TIMEOUT,
         api_version=FLY_MACHINES_API_VERSION,
-        base_url=FLY_MACHINES_API_DEFAULT_API_HOSTNAME,
+        base_url: str | None = None,
+        endpoint_selector: EndpointSelector | None = None,
+        hedge_policy: HedgePolicy | None = None,
+        client: httpx.AsyncClient | None = None,
+        rate_limiter: "RateLimiter | None" = None,
     ):
         self.api_token = api_token
         self.api_timeout = api_timeout
         self.api_version = api_version
         self.base_url = base_url
+        self.endpoint_selector = endpoint_selector or EndpointSelector.default()
+        self.hedge_policy = hedge_policy
+        self.client = client
+        self.rate_limiter = rate_limiter
 
-    async def _make_api_delete_request(
+    def _api_options(
+        self,
+    ) -> dict:
+        """Returns the settings that child API objects should inherit from this one."""
+        return {
+            "api_timeout": self.api_timeout,
+            "api_version": self.api_version,
+            "base_url": self.base_url,
+            "endpoint_selector": self.endpoint_selector,
+            "hedge_policy": self.hedge_policy,
+            "client": self.client,
+            "rate_limiter": self.rate_limiter,
+        }
+
+    async def _make_api_request(
         self,
+        method: str,
         url_path: str,
+        timeout: float | None = None,
+        **kwargs,
     ) -> httpx.Response:
-        """An internal function for making DELETE requests to the Fly Machines API."""
-        async with httpx.AsyncClient(
-            timeout=self.api_timeout,
-        ) as client:
-            r = await client.delete(
-                f"{self.base_url}/v{self.api_version}/{url_path}",
-                headers=self._generate_headers(),
-            )
+        """An internal function for sending a request to the Fly Machines API.
+
+        Requests reuse the shared client and wait on the rate limiter when they are set.
+        """
+        timeout = timeout or self.api_timeout
+
+        if self.base_url is not None:
+            base_url = self.base_url
+        else:
+            base_url = await self.endpoint_selector.resolve()
+
+        async with self.rate_limiter or nullcontext():
+            try:
+                r = await self._send_api_request(
+                    method, base_url, url_path, timeout, **kwargs
+                )
+            except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+                if (
+                    self.base_url is not None
+                    or base_url == self.endpoint_selector.public_url
+                ):
+                    raise
+
+                # The request never reached the internal API, so it's safe to resend.
+                self.endpoint_selector.report_failure(e)
+                r = await self._send_api_request(
+                    method,
+                    self.endpoint_selector.public_url,
+                    url_path,
+                    timeout,
+                    **kwargs,
+                )
+
+        if r.status_code == 429 and self.rate_limiter is not None:
+            retry_after = _parse_retry_after(r.headers.get("retry-after"))
+            self.rate_limiter.throttle(retry_after)
+
         return r
 
-    async def _make_api_get_request(
+    async def _send_api_request(
         self,
+        method: str,
+        base_url: str,
         url_path: str,
+        timeout: float,
+        **kwargs,
     ) -> httpx.Response:
-        """An internal function for making GET requests to the Fly Machines API."""
+        url = f"{base_url}/v{self.api_version}/{url_path}"
+
+        if self.client is not None:
+            return await self.client.request(
+                method,
+                url,
+                headers=self._generate_headers(),
+                timeout=timeout,
+                **kwargs,
+            )
+
         async with httpx.AsyncClient(
-            timeout=self.api_timeout,
+            timeout=timeout,
         ) as client:
-            r = await client.get(
-                f"{self.base_url}/v{self.api_version}/{url_path}",
+            r = await client.request(
+                method,
+                url,
                 headers=self._generate_headers(),
+                **kwargs,
             )
         return r
 
+    @property
+    def endpoint_status(
+        self,
+    ) -> dict:
+        """Returns the Machines API endpoint in use and, if chosen automatically, its health."""
+        if self.base_url is not None:
+            return {"base_url": self.base_url}
+        return self.endpoint_selector.status
+
+    async def _make_api_delete_request(
+        self,
+        url_path: str,
+    ) -> httpx.Response:
+        """An internal function for making DELETE requests to the Fly Machines API."""
+        return await self._make_api_request("DELETE", url_path)
+
+    async def _make_api_get_request(
+        self,
+        url_path: str,
+        hedge: bool = True,
+        timeout: float | None = None,
+    ) -> httpx.Response:
+        """An internal function for making GET requests to the Fly Machines API.
+
+        Slow requests are hedged when a hedge_policy is set, unless hedge is False.
+        """
+
+        async def _send() -> httpx.Response:
+            return await self._make_api_request("GET", url_path, timeout=timeout)
+
+        if self.hedge_policy is None or hedge is False:
+            return await _send()
+
+        return await self.hedge_policy.run(_route(url_path), _send)
+
     async def _make_api_post_request(
         self,
         url_path: str,
         payload: dict = {},
+        timeout: float | None = None,
+        content: bytes | None = None,
     ) -> httpx.Response:
-        """An internal function for making POST requests to the Fly Machines API."""
-        async with httpx.AsyncClient(
-            timeout=self.api_timeout,
-        ) as client:
-            r = await client.post(
-                f"{self.base_url}/v{self.api_version}/{url_path}",
-                headers=self._generate_headers(),
-                json=payload,
-            )
-        return r
+        """An internal function for making POST requests to the Fly Machines API.
+
+        If content is given, it is sent as an already-encoded JSON body instead of payload.
+        """
+        return await self._make_api_request(
+            "POST",
+            url_path,
+            timeout=timeout,
+            **({"json": payload} if content is None else {"content": content}),
+        )
 
     def _generate_headers(
         self,
@@ -1,12 +1,23 @@
 import asyncio
 import logging
+from typing import AsyncIterator, Callable
 
+import httpx
+
+from fly_python_sdk import (
+    DEFAULT_API_CONCURRENCY,
+    FLY_MACHINE_DEFAULT_EXEC_TIMEOUT,
+    FLY_MACHINE_DEFAULT_WAIT_TIMEOUT,
+)
 from fly_python_sdk.exceptions import FlyError
 from fly_python_sdk.fly.api import FlyApi
+from fly_python_sdk.fly.informer import MachineInformer
 from fly_python_sdk.fly.machine import Machine
+from fly_python_sdk.fly.readiness import MachineReadinessWaiter
+from fly_python_sdk.fly.template import MachineTemplate
 from fly_python_sdk.fly.volume import Volume
 from fly_python_sdk.models.app import FlyApp
-from fly_python_sdk.models.machine import FlyMachine
+from fly_python_sdk.models.machine import FlyMachine, FlyMachineExecResult
 from fly_python_sdk.models.volume import FlyVolume
 
 
@@ -20,8 +31,9 @@ class App(FlyApi):
         api_token,
         org_slug,
         app_name,
+        **api_options,
     ):
-        super().__init__(api_token)
+        super().__init__(api_token, **api_options)
         self.org_slug = org_slug
         self.app_name = app_name
 
@@ -69,36 +81,78 @@ class App(FlyApi):
             region: The deployment region for the machine.
         """
 
-        logging.info(f"Creating machine in this region: {machine.region}...")
-        logging.info(f"Creating machine with this config: {machine.config}...")
+        logging.info("Creating machine in this region: %s...", machine.region)
+        logging.info("Creating machine with this config: %s...", machine.config)
 
         r = await self._make_api_post_request(
             f"apps/{self.app_name}/machines",
             payload=machine.model_dump(exclude_none=True),
         )
 
-        if r.status_code != 200:
-            logging.error(r.status_code)
-            raise FlyError(message=f"{r.status_code}: Unable to create machine!")
+        return self._parse_created_machine(r)
 
-        created_machine = FlyMachine(**r.json())
+    async def create_machine_from_template(
+        self,
+        template: MachineTemplate,
+        **overrides,
+    ) -> FlyMachine:
+        """Creates a Fly machine from a pre-serialized MachineTemplate.
 
+        Args:
+            template: The MachineTemplate containing the base machine config.
+            overrides: Per-machine name, region, env and metadata values.
+        """
         logging.info(
-            f"Machine {created_machine.id} has been created in {machine.region}."
+            "Creating machine from template in this region: %s...",
+            overrides.get("region"),
         )
 
-        return created_machine
+        r = await self._make_api_post_request(
+            f"apps/{self.app_name}/machines",
+            content=template.render(**overrides),
+        )
+
+        return self._parse_created_machine(r)
 
     async def create_machines(
         self,
-        machines: list[FlyMachine],
+        machines: list[FlyMachine | tuple[MachineTemplate, dict]],
     ):
+        """
+        Creates multiple Fly machines.
+
+        Args:
+            machines: FlyMachine objects, or (MachineTemplate, overrides) pairs.
+        """
         created_machines = await asyncio.gather(
-            *[self.create_machine(machine) for machine in machines]
+            *[
+                self.create_machine(machine)
+                if isinstance(machine, FlyMachine)
+                else self.create_machine_from_template(machine[0], **machine[1])
+                for machine in machines
+            ]
         )
 
         return created_machines
 
+    def _parse_created_machine(
+        self,
+        r: httpx.Response,
+    ) -> FlyMachine:
+        if r.status_code != 200:
+            logging.error(r.status_code)
+            raise FlyError(message=f"{r.status_code}: Unable to create machine!")
+
+        created_machine = FlyMachine.model_validate_json(r.content)
+
+        logging.info(
+            "Machine %s has been created in %s.",
+            created_machine.id,
+            created_machine.region,
+        )
+
+        return created_machine
+
     async def list_machines(
         self,
         regions: list[str] = [],
@@ -142,6 +196,86 @@ class App(FlyApi):
 
         return results
 
+    def wait_ready(
+        self,
+        machine_ids: list[str],
+        timeout: float = FLY_MACHINE_DEFAULT_WAIT_TIMEOUT,
+    ) -> MachineReadinessWaiter:
+        """
+        Waits for many machines to be started with all of their checks passing.
+
+        All machines are tracked by a single list_machines poll. This returns
+        immediately; await the result to wait for every machine, or await its
+        per-machine `futures` individually.
+
+        Args:
+            machine_ids (list[str]): The IDs of the machines to wait for.
+            timeout (float): The number of seconds to wait. Defaults to 60.
+        """
+        return MachineReadinessWaiter(self, machine_ids, timeout=timeout)
+
+    async def exec_all(
+        self,
+        cmd: str | list[str],
+        selector: Callable[[FlyMachine], bool] | None = None,
+        concurrency: int = DEFAULT_API_CONCURRENCY,
+        timeout: int = FLY_MACHINE_DEFAULT_EXEC_TIMEOUT,
+    ) -> AsyncIterator[FlyMachineExecResult]:
+        """
+        Runs a command on many Fly machines, yielding results as they complete.
+
+        Args:
+            cmd (str | list[str]): The command to run on each machine.
+            selector (Callable[[FlyMachine], bool]): Picks the machines to run on.
+                Defaults to every machine in the started state.
+            concurrency (int): The maximum number of commands in flight. Defaults to 10.
+            timeout (int): The per-machine command timeout in seconds. Defaults to 30.
+                Each request may take up to api_timeout + timeout seconds, see Machine.exec().
+
+        Close the iterator early, e.g. with contextlib.aclosing, to cancel the
+        commands that haven't finished.
+        """
+        if selector is None:
+            selector = lambda machine: machine.state == "started"  # noqa: E731
+
+        machines = [
+            machine for machine in await self.list_machines() if selector(machine)
+        ]
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _exec(machine_id: str) -> FlyMachineExecResult:
+            async with semaphore:
+                try:
+                    response = await self.Machine(machine_id).exec(cmd, timeout=timeout)
+                except (FlyError, httpx.HTTPError) as e:
+                    return FlyMachineExecResult(
+                        machine_id=machine_id,
+                        error=str(e) or type(e).__name__,
+                    )
+            return FlyMachineExecResult(machine_id=machine_id, response=response)
+
+        tasks = [asyncio.create_task(_exec(machine.id)) for machine in machines]
+
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            # Don't leave commands running if the caller stops iterating early.
+            for task in tasks:
+                task.cancel()
+
+    def Informer(
+        self,
+        interval: float | None = None,
+    ) -> MachineInformer:
+        """
+        Returns the shared MachineInformer for this app. See MachineInformer.for_app().
+
+        Args:
+            interval (float): Seconds between polls if the informer is created. Defaults to 5.
+        """
+        return MachineInformer.for_app(self, interval=interval)
+
     def Machine(
         self,
         machine_id: str | None = None,
@@ -151,12 +285,39 @@ class App(FlyApi):
             org_slug=self.org_slug,
             app_name=self.app_name,
             machine_id=machine_id,
+            **self._api_options(),
         )
 
     ##################
     # Volume Methods #
     ##################
 
+    async def create_volume(
+        self,
+        name: str,
+        region: str,
+        size_gb: int = 1,
+    ) -> FlyVolume:
+        """
+        Creates a volume in a Fly app.
+
+        Args:
+            name (str): The name of the volume.
+            region (str): The region to create the volume in.
+            size_gb (int): The size of the volume in GB. Defaults to 1.
+        """
+        r = await self._make_api_post_request(
+            f"apps/{self.app_name}/volumes",
+            payload={"name": name, "region": region, "size_gb": size_gb},
+        )
+
+        if r.status_code != 200:
+            raise FlyError(
+                message=f"{r.status_code}: Unable to create {name} in {self.app_name}!"
+            )
+
+        return FlyVolume(**r.json())
+
     async def list_volumes(
         self,
         app_name: str,
@@ -176,10 +337,11 @@ class App(FlyApi):
 
         return volumes
 
-    def Volume(self, app_name) -> Volume:
+    def Volume(self, volume_id) -> Volume:
         return Volume(
             api_token=self.api_token,
             org_slug=self.org_slug,
-            app_name=app_name,
-            machine_id=self.machine_id,
+            app_name=self.app_name,
+            volume_id=volume_id,
+            **self._api_options(),
         )
@@ -0,0 +1,149 @@
+import asyncio
+import logging
+import os
+import time
+from urllib.parse import urlsplit
+
+from fly_python_sdk import (
+    FLY_MACHINES_API_DEFAULT_API_HOSTNAME,
+    FLY_MACHINES_API_ENDPOINT_PROBE_INTERVAL,
+    FLY_MACHINES_API_INTERNAL_API_HOSTNAME,
+)
+
+FLY_ENDPOINT_PROBE_TIMEOUT = 1.0
+
+
+def running_on_fly() -> bool:
+    """Returns True if this process is running on a Fly machine."""
+    return bool(os.environ.get("FLY_MACHINE_ID") or os.environ.get("FLY_ALLOC_ID"))
+
+
+class EndpointSelector:
+    """
+    Chooses between the internal and public Fly Machines API endpoints.
+
+    On Fly, the internal endpoint is preferred as long as it can be reached.
+    If it can't, requests fall back to the public endpoint until the internal
+    endpoint passes a probe again, which is retried every probe_interval seconds.
+    """
+
+    _default: "EndpointSelector | None" = None
+
+    def __init__(
+        self,
+        internal_url: str = FLY_MACHINES_API_INTERNAL_API_HOSTNAME,
+        public_url: str = FLY_MACHINES_API_DEFAULT_API_HOSTNAME,
+        probe_interval: float = FLY_MACHINES_API_ENDPOINT_PROBE_INTERVAL,
+        probe_timeout: float = FLY_ENDPOINT_PROBE_TIMEOUT,
+        prefer_internal: bool | None = None,
+    ):
+        self.internal_url = internal_url
+        self.public_url = public_url
+        self.probe_interval = probe_interval
+        self.probe_timeout = probe_timeout
+        self.prefer_internal = (
+            running_on_fly() if prefer_internal is None else prefer_internal
+        )
+        self.internal_healthy: bool | None = None
+        # A time.monotonic() reading, so wall clock changes don't affect re-probes.
+        self.last_probe_at: float | None = None
+        self.last_error: str | None = None
+
+    @classmethod
+    def default(
+        cls,
+    ) -> "EndpointSelector":
+        """Returns the selector shared by every FlyApi that doesn't set a base_url."""
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    @property
+    def base_url(
+        self,
+    ) -> str:
+        """Returns the endpoint requests are currently sent to."""
+        if self.prefer_internal and self.internal_healthy:
+            return self.internal_url
+        return self.public_url
+
+    @property
+    def status(
+        self,
+    ) -> dict:
+        """Returns the chosen endpoint and the health of the internal endpoint."""
+        return {
+            "base_url": self.base_url,
+            "internal_url": self.internal_url,
+            "public_url": self.public_url,
+            "prefer_internal": self.prefer_internal,
+            "internal_healthy": self.internal_healthy,
+            "seconds_since_probe": (
+                None
+                if self.last_probe_at is None
+                else time.monotonic() - self.last_probe_at
+            ),
+            "last_error": self.last_error,
+        }
+
+    async def resolve(
+        self,
+    ) -> str:
+        """Returns the endpoint to use, probing the internal endpoint when it's due."""
+        if not self.prefer_internal:
+            return self.public_url
+
+        if (
+            self.last_probe_at is None
+            or time.monotonic() - self.last_probe_at >= self.probe_interval
+        ):
+            # Claim the probe so concurrent requests use the current endpoint
+            # instead of probing again.
+            self.last_probe_at = time.monotonic()
+            await self.probe()
+
+        return self.base_url
+
+    async def probe(
+        self,
+    ) -> bool:
+        """Checks whether the internal endpoint accepts connections."""
+        url = urlsplit(self.internal_url)
+        port = url.port or (443 if url.scheme == "https" else 80)
+
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(url.hostname, port),
+                timeout=self.probe_timeout,
+            )
+            writer.close()
+            await writer.wait_closed()
+        except (OSError, asyncio.TimeoutError) as e:
+            self.report_failure(e)
+            return False
+
+        if self.internal_healthy is not True:
+            logging.info("Using the internal Machines API at %s.", self.internal_url)
+
+        self.internal_healthy = True
+        self.last_probe_at = time.monotonic()
+        self.last_error = None
+
+        return True
+
+    def report_failure(
+        self,
+        error: Exception,
+    ) -> None:
+        """Falls back to the public endpoint until the next successful probe."""
+        if self.internal_healthy is not False:
+            logging.warning(
+                "Internal Machines API at %s is unreachable, falling back to %s: %s",
+                self.internal_url,
+                self.public_url,
+                error,
+            )
+
+        self.internal_healthy = False
+        self.last_probe_at = time.monotonic()
+        self.last_error = str(error) or type(error).__name__
@@ -0,0 +1,141 @@
+import asyncio
+import logging
+from collections import defaultdict, deque
+from typing import Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+FLY_HEDGE_DEFAULT_PERCENTILE = 0.95
+FLY_HEDGE_DEFAULT_BUDGET = 0.05
+FLY_HEDGE_DEFAULT_INITIAL_DELAY = 1.0
+FLY_HEDGE_DEFAULT_WINDOW = 200
+FLY_HEDGE_DEFAULT_MIN_SAMPLES = 20
+
+
+def _route(url_path: str) -> str:
+    """Collapses the names and IDs in a Fly Machines API path, e.g. apps/{}/machines/{}."""
+    segments = url_path.split("?")[0].strip("/").split("/")
+    return "/".join(
+        segment if index % 2 == 0 else "{}" for index, segment in enumerate(segments)
+    )
+
+
+class HedgePolicy:
+    """
+    Sends a duplicate of a slow idempotent request and returns whichever response arrives first.
+
+    A request is hedged once it has taken longer than the observed percentile
+    latency for its route. Hedges are capped at `budget` times the number of
+    requests so that hedging never adds more than a small fraction of load.
+    """
+
+    def __init__(
+        self,
+        percentile: float = FLY_HEDGE_DEFAULT_PERCENTILE,
+        budget: float = FLY_HEDGE_DEFAULT_BUDGET,
+        initial_delay: float = FLY_HEDGE_DEFAULT_INITIAL_DELAY,
+        window: int = FLY_HEDGE_DEFAULT_WINDOW,
+        min_samples: int = FLY_HEDGE_DEFAULT_MIN_SAMPLES,
+    ):
+        self.percentile = percentile
+        self.budget = budget
+        self.initial_delay = initial_delay
+        self.min_samples = min_samples
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.budget_exhausted = 0
+        self._latencies: dict[str, deque[float]] = defaultdict(
+            lambda: deque(maxlen=window)
+        )
+
+    @property
+    def stats(
+        self,
+    ) -> dict[str, int]:
+        """Returns counters describing how often requests were hedged."""
+        return {
+            "requests": self.requests,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "budget_exhausted": self.budget_exhausted,
+        }
+
+    def delay(
+        self,
+        route: str,
+    ) -> float:
+        """Returns how long to wait on a request to `route` before hedging it."""
+        latencies = self._latencies[route]
+
+        if len(latencies) < self.min_samples:
+            return self.initial_delay
+
+        ordered = sorted(latencies)
+        return ordered[min(int(len(ordered) * self.percentile), len(ordered) - 1)]
+
+    async def run(
+        self,
+        route: str,
+        send: Callable[[], Awaitable[T]],
+    ) -> T:
+        """
+        Runs `send`, starting a second copy if the first is slower than the hedge delay.
+
+        Args:
+            route (str): The route used to group latency samples.
+            send (Callable): Returns a new awaitable request each time it is called.
+        """
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        self.requests += 1
+
+        primary = asyncio.ensure_future(send())
+
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=self.delay(route))
+
+            if not done:
+                if self.hedges + 1 > self.budget * self.requests:
+                    self.budget_exhausted += 1
+                    await asyncio.wait({primary})
+                else:
+                    self.hedges += 1
+                    logging.debug("Hedging slow request to %s.", route)
+                    hedge = asyncio.ensure_future(send())
+                    winner = await self._first_success(primary, hedge)
+                    if winner is hedge:
+                        self.hedge_wins += 1
+                    primary = winner
+        except asyncio.CancelledError:
+            primary.cancel()
+            raise
+
+        result = primary.result()
+        self._latencies[route].append(loop.time() - started_at)
+
+        return result
+
+    async def _first_success(
+        self,
+        primary: asyncio.Future,
+        hedge: asyncio.Future,
+    ) -> asyncio.Future:
+        """Returns the first request to succeed, or the primary if both fail."""
+        pending = {primary, hedge}
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task
+        finally:
+            for task in pending:
+                task.cancel()
+
+        # Retrieve the hedge's error so it isn't reported as unhandled.
+        hedge.exception()
+        return primary
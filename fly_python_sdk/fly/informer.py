@@ -0,0 +1,239 @@
+import asyncio
+import logging
+from collections import defaultdict
+from typing import TYPE_CHECKING, AsyncIterator
+
+import httpx
+
+from fly_python_sdk.exceptions import FlyError
+from fly_python_sdk.models.machine import FlyMachine, FlyMachineChangeEvent
+
+if TYPE_CHECKING:
+    from fly_python_sdk.fly.app import App
+
+FLY_INFORMER_DEFAULT_INTERVAL = 5
+
+# Pushed to every subscriber queue by stop() to end its subscription.
+_STOPPED = object()
+
+
+class MachineInformer:
+    """
+    Keeps a live index of the machines in a Fly app and publishes changes to subscribers.
+
+    One informer is shared per app (see for_app), so any number of subscribers
+    are served by a single list_machines poll. Each poll is diffed against the
+    previous one and published as "added", "updated" and "removed" events.
+    """
+
+    _informers: dict[tuple[str, str], "MachineInformer"] = {}
+
+    def __init__(
+        self,
+        app: "App",
+        interval: float = FLY_INFORMER_DEFAULT_INTERVAL,
+    ):
+        self.app = app
+        self.interval = interval
+        self.machines: dict[str, FlyMachine] = {}
+        self._by_region: dict[str, set[str]] = defaultdict(set)
+        self._by_state: dict[str, set[str]] = defaultdict(set)
+        self._subscribers: set[asyncio.Queue] = set()
+        self._synced = asyncio.Event()
+        self._poll_task: asyncio.Task | None = None
+
+    @classmethod
+    def for_app(
+        cls,
+        app: "App",
+        interval: float | None = None,
+    ) -> "MachineInformer":
+        """
+        Returns the shared informer for an app, creating it if needed.
+
+        Informers are keyed by API token and app name. An existing informer keeps
+        polling through the App it was created with, including its HTTP client,
+        hedge policy and endpoint, so stop() it before closing that client (e.g.
+        with FlyClientManager.close()); the next call then creates a new one.
+
+        Args:
+            interval (float): Seconds between polls if the informer is created.
+                Defaults to 5. Raises a FlyError if it differs from the interval
+                of an existing informer.
+        """
+        key = (app.api_token, app.app_name)
+        informer = cls._informers.get(key)
+
+        if informer is None:
+            if interval is None:
+                interval = FLY_INFORMER_DEFAULT_INTERVAL
+            informer = cls(app, interval=interval)
+            cls._informers[key] = informer
+        elif interval is not None and interval != informer.interval:
+            raise FlyError(
+                message=f"The informer for {app.app_name} already polls every {informer.interval}s."
+            )
+
+        return informer
+
+    #################
+    # Index Methods #
+    #################
+
+    def get(
+        self,
+        machine_id: str,
+    ) -> FlyMachine | None:
+        return self.machines.get(machine_id)
+
+    def list_machines(
+        self,
+        region: str | None = None,
+        state: str | None = None,
+    ) -> list[FlyMachine]:
+        """
+        Returns the indexed machines that match every given filter.
+
+        Args:
+            region (str): Only return machines in this region.
+            state (str): Only return machines in this state.
+        """
+        machine_ids = set(self.machines)
+        if region is not None:
+            machine_ids &= self._by_region.get(region, set())
+        if state is not None:
+            machine_ids &= self._by_state.get(state, set())
+
+        return [self.machines[machine_id] for machine_id in sorted(machine_ids)]
+
+    async def wait_synced(
+        self,
+    ) -> None:
+        """Waits until the index has been populated by at least one poll."""
+        await self._synced.wait()
+
+    #####################
+    # Lifecycle Methods #
+    #####################
+
+    async def start(
+        self,
+    ) -> None:
+        """Starts polling in the background."""
+        if self._poll_task is None or self._poll_task.done():
+            self._poll_task = asyncio.create_task(self._poll_loop())
+
+    async def stop(
+        self,
+    ) -> None:
+        """Stops polling, ends every subscription and unregisters this informer."""
+        if self._poll_task is not None:
+            self._poll_task.cancel()
+            try:
+                await self._poll_task
+            except asyncio.CancelledError:
+                pass
+            self._poll_task = None
+
+        for queue in self._subscribers:
+            queue.put_nowait(_STOPPED)
+        self._subscribers.clear()
+
+        key = (self.app.api_token, self.app.app_name)
+        if self._informers.get(key) is self:
+            del self._informers[key]
+
+    async def subscribe(
+        self,
+    ) -> AsyncIterator[FlyMachineChangeEvent]:
+        """
+        Yields change events as they are observed, starting the informer if needed.
+
+        New subscribers receive an "added" event for every machine already in the index.
+        The subscription ends when the informer is stopped.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        for machine in self.machines.values():
+            queue.put_nowait(FlyMachineChangeEvent(type="added", machine=machine))
+
+        self._subscribers.add(queue)
+        await self.start()
+
+        try:
+            while True:
+                event = await queue.get()
+                if event is _STOPPED:
+                    return
+                yield event
+        finally:
+            self._subscribers.discard(queue)
+
+    async def sync(
+        self,
+    ) -> list[FlyMachineChangeEvent]:
+        """Polls the app once, updates the index and publishes any changes."""
+        snapshot = {machine.id: machine for machine in await self.app.list_machines()}
+        events = []
+
+        for machine_id, machine in snapshot.items():
+            previous = self.machines.get(machine_id)
+            if previous is None:
+                events.append(FlyMachineChangeEvent(type="added", machine=machine))
+            elif previous != machine:
+                events.append(
+                    FlyMachineChangeEvent(
+                        type="updated", machine=machine, previous=previous
+                    )
+                )
+
+        for machine_id in self.machines.keys() - snapshot.keys():
+            events.append(
+                FlyMachineChangeEvent(
+                    type="removed", machine=self.machines[machine_id]
+                )
+            )
+
+        for event in events:
+            self._unindex(event.previous or event.machine)
+            if event.type != "removed":
+                self._index(event.machine)
+
+        self.machines = snapshot
+        self._synced.set()
+
+        for event in events:
+            for queue in self._subscribers:
+                queue.put_nowait(event)
+
+        return events
+
+    async def _poll_loop(
+        self,
+    ) -> None:
+        while True:
+            try:
+                await self.sync()
+            except (FlyError, httpx.HTTPError) as e:
+                logging.warning(
+                    "Unable to poll machines in %s: %s", self.app.app_name, e
+                )
+            except Exception:
+                # Keep polling so one bad response doesn't freeze the index.
+                logging.exception(
+                    "Unexpected error polling machines in %s.", self.app.app_name
+                )
+            await asyncio.sleep(self.interval)
+
+    def _index(
+        self,
+        machine: FlyMachine,
+    ) -> None:
+        self._by_region[machine.region].add(machine.id)
+        self._by_state[machine.state].add(machine.id)
+
+    def _unindex(
+        self,
+        machine: FlyMachine,
+    ) -> None:
+        self._by_region[machine.region].discard(machine.id)
+        self._by_state[machine.state].discard(machine.id)
@@ -1,8 +1,22 @@
+import asyncio
 import logging
+import shlex
 
+import httpx
+
+from fly_python_sdk import (
+    DEFAULT_API_CONCURRENCY,
+    FLY_MACHINE_DEFAULT_EXEC_TIMEOUT,
+    FLY_MACHINE_DEFAULT_WAIT_TIMEOUT,
+)
 from fly_python_sdk.exceptions import FlyError
 from fly_python_sdk.fly.api import FlyApi
-from fly_python_sdk.models.machine import FlyMachine, FlyMachineEvent
+from fly_python_sdk.fly.template import MachineTemplate
+from fly_python_sdk.models.machine import (
+    FlyMachine,
+    FlyMachineEvent,
+    FlyMachineExecResponse,
+)
 
 
 class Machine(FlyApi):
@@ -16,8 +30,9 @@ class Machine(FlyApi):
         org_slug,
         app_name,
         machine_id: str | None = None,
+        **api_options,
     ):
-        super().__init__(api_token)
+        super().__init__(api_token, **api_options)
         self.org_slug = org_slug
         self.app_name = app_name
         self.machine_id = machine_id
@@ -32,12 +47,17 @@ class Machine(FlyApi):
 
     async def destroy(
         self,
+        force: bool = False,
     ) -> None:
         """
         Destroys a Fly machine.
+
+        Args:
+            force (bool): If True, destroy the machine even if it is running. Defaults to False.
         """
         r = await self._make_api_delete_request(
             f"apps/{self.app_name}/machines/{self.machine_id}"
+            + ("?force=true" if force is True else "")
         )
 
         if r.status_code != 200:
@@ -124,6 +144,32 @@ class Machine(FlyApi):
 
         return
 
+    async def wait(
+        self,
+        state: str = "started",
+        timeout: int = FLY_MACHINE_DEFAULT_WAIT_TIMEOUT,
+    ) -> None:
+        """
+        Waits for a Fly machine to reach a state.
+
+        Args:
+            state (str): The state to wait for. Defaults to "started".
+            timeout (int): The number of seconds to wait. Defaults to 60.
+        """
+        # This is a long poll, so a hedged duplicate would only add load.
+        r = await self._make_api_get_request(
+            f"apps/{self.app_name}/machines/{self.machine_id}/wait?state={state}&timeout={timeout}",
+            hedge=False,
+            timeout=self.api_timeout + timeout,
+        )
+
+        if r.status_code != 200:
+            raise FlyError(
+                message=f"{r.status_code}: {self.machine_id} in {self.app_name} did not reach the {state} state!"
+            )
+
+        return
+
     #################
     # Event Methods #
     #################
@@ -139,10 +185,55 @@ class Machine(FlyApi):
             f"apps/{self.app_name}/machines/{self.machine_id}/events"
         )
 
+        if r.status_code != 200:
+            raise FlyError(
+                message=f"Unable to get events for {self.machine_id} in {self.app_name}!"
+            )
+
         events = [FlyMachineEvent(**event) for event in r.json()]
 
         return events
 
+    ################
+    # Exec Methods #
+    ################
+
+    async def exec(
+        self,
+        cmd: str | list[str],
+        timeout: int = FLY_MACHINE_DEFAULT_EXEC_TIMEOUT,
+    ) -> FlyMachineExecResponse:
+        """
+        Runs a command on a Fly machine and returns its output.
+
+        Args:
+            cmd (str | list[str]): The command to run. Strings are split using shell-like syntax.
+            timeout (int): The number of seconds the command is allowed to run. Defaults to 30.
+                This is enforced by the machine; the request itself may take up to
+                api_timeout + timeout seconds (90 by default) if the machine doesn't answer.
+        """
+        if not self.machine_id:
+            raise FlyError(
+                message="Please provide the ID of the Machine you want to exec on."
+            )
+
+        if isinstance(cmd, str):
+            cmd = shlex.split(cmd)
+
+        # The HTTP request has to outlive the command itself.
+        r = await self._make_api_post_request(
+            f"apps/{self.app_name}/machines/{self.machine_id}/exec",
+            payload={"command": cmd, "timeout": timeout},
+            timeout=self.api_timeout + timeout,
+        )
+
+        if r.status_code != 200:
+            raise FlyError(
+                message=f"{r.status_code}: Unable to exec on {self.machine_id} in {self.app_name}!"
+            )
+
+        return FlyMachineExecResponse(**r.json())
+
     ###################
     # Utility Methods #
     ###################
@@ -164,15 +255,96 @@ class Machine(FlyApi):
         if region is None:
             region = source_machine.region
 
-        new_machine = FlyMachine(
-            name=name,
-            region=region,
-            config=source_machine.config,
+        return await self._create_clone(
+            MachineTemplate(source_machine.config), name=name, region=region
         )
 
+    async def clone_many(
+        self,
+        count: int,
+        regions: list[str] | None = None,
+        name_pattern: str | None = None,
+        concurrency: int = DEFAULT_API_CONCURRENCY,
+        wait: bool = False,
+        wait_timeout: int = FLY_MACHINE_DEFAULT_WAIT_TIMEOUT,
+    ) -> list[FlyMachine | Exception]:
+        """
+        Clone a Fly machine many times, spreading the clones across regions.
+
+        The source machine is only inspected once. Results are returned in order,
+        with an exception in place of any clone that could not be created or started.
+
+        Args:
+            count (int): The number of clones to create.
+            regions (list[str]): Regions to assign to clones in round-robin order.
+                Defaults to the region of the source machine.
+            name_pattern (str): A format string for clone names, e.g. "{name}-{region}-{index}".
+                Defaults to None, which lets Fly generate names.
+            concurrency (int): The maximum number of clones created at once. Defaults to 10.
+            wait (bool): If True, wait for each clone to reach the started state.
+            wait_timeout (int): The number of seconds to wait for each clone. Defaults to 60.
+        """
+        source_machine = await self.inspect()
+        template = MachineTemplate(source_machine.config)
+
+        if not regions:
+            regions = [source_machine.region]
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _clone(index: int) -> FlyMachine | Exception:
+            region = regions[index % len(regions)]
+            name = None
+            if name_pattern is not None:
+                name = name_pattern.format(
+                    name=source_machine.name, region=region, index=index
+                )
+
+            try:
+                # Only creates are limited, so booting clones don't hold up new ones.
+                async with semaphore:
+                    new_machine = await self._create_clone(
+                        template, name=name, region=region
+                    )
+                if wait is True:
+                    await self._sibling(new_machine.id).wait(
+                        "started", timeout=wait_timeout
+                    )
+            except (FlyError, httpx.HTTPError) as e:
+                logging.warning("Unable to clone %s: %s", self.machine_id, e)
+                return e
+
+            return new_machine
+
+        return await asyncio.gather(*[_clone(index) for index in range(count)])
+
+    async def _create_clone(
+        self,
+        template: MachineTemplate,
+        name: str | None,
+        region: str | None,
+    ) -> FlyMachine:
         r = await self._make_api_post_request(
             f"apps/{self.app_name}/machines",
-            payload=new_machine.model_dump(exclude_none=True),
+            content=template.render(name=name, region=region),
         )
 
-        return FlyMachine(**r.json())
+        if r.status_code != 200:
+            raise FlyError(
+                message=f"{r.status_code}: Unable to clone {self.machine_id} in {self.app_name}!"
+            )
+
+        return FlyMachine.model_validate_json(r.content)
+
+    def _sibling(
+        self,
+        machine_id: str,
+    ) -> "Machine":
+        """Returns a Machine for another machine in the same app."""
+        return Machine(
+            api_token=self.api_token,
+            org_slug=self.org_slug,
+            app_name=self.app_name,
+            machine_id=machine_id,
+            **self._api_options(),
+        )
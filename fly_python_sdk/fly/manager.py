@@ -0,0 +1,262 @@
+import asyncio
+from collections import deque
+
+import httpx
+
+from fly_python_sdk import DEFAULT_API_CONCURRENCY, DEFAULT_API_TIMEOUT
+from fly_python_sdk.exceptions import FlyError
+from fly_python_sdk.fly.org import Org
+
+FLY_MANAGER_DEFAULT_MAX_CONCURRENCY = 50
+FLY_MANAGER_DEFAULT_RATE = 10.0
+FLY_MANAGER_DEFAULT_BURST = 20
+
+
+class FairScheduler:
+    """
+    Shares a fixed number of request slots between tenants in round-robin order.
+
+    When every slot is busy, freed slots go to the next tenant that is waiting
+    rather than to whichever request queued first, so a tenant with a deep
+    backlog cannot starve the others.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = FLY_MANAGER_DEFAULT_MAX_CONCURRENCY,
+    ):
+        self.available = max_concurrency
+        self._waiters: dict[str, deque[asyncio.Future]] = {}
+        self._rotation: deque[str] = deque()
+
+    async def acquire(
+        self,
+        tenant: str,
+    ) -> None:
+        """Waits for a request slot on behalf of `tenant`."""
+        if self.available > 0 and not self._rotation:
+            self.available -= 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        if tenant not in self._waiters:
+            self._waiters[tenant] = deque()
+            self._rotation.append(tenant)
+        self._waiters[tenant].append(waiter)
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as we were cancelled.
+                self.release()
+            else:
+                self._discard(tenant, waiter)
+            raise
+
+    def release(
+        self,
+    ) -> None:
+        """Returns a request slot, handing it to the next waiting tenant if there is one."""
+        while self._rotation:
+            tenant = self._rotation.popleft()
+            waiter = self._waiters[tenant].popleft()
+
+            if self._waiters[tenant]:
+                self._rotation.append(tenant)
+            else:
+                del self._waiters[tenant]
+
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+        self.available += 1
+
+    def _discard(
+        self,
+        tenant: str,
+        waiter: asyncio.Future,
+    ) -> None:
+        waiters = self._waiters.get(tenant)
+        if waiters is None or waiter not in waiters:
+            return
+
+        waiters.remove(waiter)
+        if not waiters:
+            del self._waiters[tenant]
+            self._rotation.remove(tenant)
+
+
+class RateLimiter:
+    """
+    Limits the request rate and concurrency of a single API token.
+
+    Requests spend tokens from a bucket that refills at `rate` per second up to
+    `burst`, hold one of `max_concurrency` per-token slots, and then wait for a
+    shared slot from the FairScheduler.
+    """
+
+    def __init__(
+        self,
+        tenant: str,
+        scheduler: FairScheduler,
+        rate: float = FLY_MANAGER_DEFAULT_RATE,
+        burst: int = FLY_MANAGER_DEFAULT_BURST,
+        max_concurrency: int = DEFAULT_API_CONCURRENCY,
+    ):
+        self.tenant = tenant
+        self.scheduler = scheduler
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at: float | None = None
+        self._throttled_until = 0.0
+        self._lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def __aenter__(
+        self,
+    ) -> "RateLimiter":
+        await self._take_token()
+        await self._semaphore.acquire()
+        try:
+            await self.scheduler.acquire(self.tenant)
+        except BaseException:
+            self._semaphore.release()
+            raise
+        return self
+
+    async def __aexit__(
+        self,
+        *exc_info,
+    ) -> None:
+        self.scheduler.release()
+        self._semaphore.release()
+
+    def throttle(
+        self,
+        seconds: float,
+    ) -> None:
+        """Pauses new requests for this token, e.g. after the API returns a 429."""
+        loop = asyncio.get_running_loop()
+        self._throttled_until = max(self._throttled_until, loop.time() + seconds)
+
+    async def _take_token(
+        self,
+    ) -> None:
+        loop = asyncio.get_running_loop()
+
+        async with self._lock:
+            while True:
+                now = loop.time()
+                if self._updated_at is not None:
+                    self._tokens = min(
+                        self.burst, self._tokens + (now - self._updated_at) * self.rate
+                    )
+                self._updated_at = now
+
+                if now < self._throttled_until:
+                    await asyncio.sleep(self._throttled_until - now)
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                else:
+                    await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class FlyClientManager:
+    """
+    Manages Fly.io API access for many organizations, each with its own API token.
+
+    Every token gets its own pooled HTTP client and RateLimiter, so a token that
+    is busy or rate limited only slows down the organizations that use it.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = FLY_MANAGER_DEFAULT_MAX_CONCURRENCY,
+        api_timeout=DEFAULT_API_TIMEOUT,
+        **api_options,
+    ):
+        self.scheduler = FairScheduler(max_concurrency)
+        self.api_timeout = api_timeout
+        self.api_options = api_options
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._rate_limiters: dict[str, RateLimiter] = {}
+        self._org_tokens: dict[str, str] = {}
+
+    async def __aenter__(
+        self,
+    ) -> "FlyClientManager":
+        return self
+
+    async def __aexit__(
+        self,
+        *exc_info,
+    ) -> None:
+        await self.close()
+
+    def add_org(
+        self,
+        org_slug: str,
+        api_token: str,
+        rate: float = FLY_MANAGER_DEFAULT_RATE,
+        burst: int = FLY_MANAGER_DEFAULT_BURST,
+        max_concurrency: int = DEFAULT_API_CONCURRENCY,
+    ) -> None:
+        """
+        Registers an organization and the API token used to access it.
+
+        Organizations that share a token also share its client and rate budget;
+        rate, burst and max_concurrency only apply the first time a token is added.
+
+        Args:
+            org_slug (str): The slug of the organization.
+            api_token (str): The Fly.io API token for the organization.
+            rate (float): The sustained number of requests per second for the token.
+            burst (int): The number of requests the token can make at once after idling.
+            max_concurrency (int): The maximum number of in-flight requests for the token.
+        """
+        self._org_tokens[org_slug] = api_token
+
+        if api_token not in self._clients:
+            tenant = f"tenant-{len(self._clients)}"
+            self._clients[api_token] = httpx.AsyncClient(
+                timeout=self.api_timeout,
+                limits=httpx.Limits(max_connections=max_concurrency),
+            )
+            self._rate_limiters[api_token] = RateLimiter(
+                tenant,
+                self.scheduler,
+                rate=rate,
+                burst=burst,
+                max_concurrency=max_concurrency,
+            )
+
+    def Org(
+        self,
+        org_slug: str,
+    ) -> Org:
+        if org_slug not in self._org_tokens:
+            raise FlyError(message=f"No API token has been added for {org_slug}.")
+
+        api_token = self._org_tokens[org_slug]
+
+        return Org(
+            api_token=api_token,
+            org_slug=org_slug,
+            api_timeout=self.api_timeout,
+            client=self._clients[api_token],
+            rate_limiter=self._rate_limiters[api_token],
+            **self.api_options,
+        )
+
+    async def close(
+        self,
+    ) -> None:
+        """Closes every pooled HTTP client."""
+        await asyncio.gather(*[client.aclose() for client in self._clients.values()])
+        self._clients.clear()
+        self._rate_limiters.clear()
+        self._org_tokens.clear()
@@ -15,8 +15,9 @@ class Org(FlyApi):
         self,
         api_token,
         org_slug: str = "personal",
+        **api_options,
     ):
-        super().__init__(api_token)
+        super().__init__(api_token, **api_options)
         self.org_slug = org_slug
 
     ###############
@@ -94,4 +95,5 @@ class Org(FlyApi):
             api_token=self.api_token,
             org_slug=self.org_slug,
             app_name=app_name,
+            **self._api_options(),
         )
@@ -0,0 +1,229 @@
+import asyncio
+import json
+import logging
+import statistics
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+
+import httpx
+
+from fly_python_sdk import DEFAULT_API_CONCURRENCY
+from fly_python_sdk.exceptions import FlyError
+from fly_python_sdk.models.machine import (
+    FlyMachine,
+    FlyMachineEvent,
+    FlyMachineTimeline,
+)
+
+if TYPE_CHECKING:
+    from fly_python_sdk.fly.app import App
+    from fly_python_sdk.fly.readiness import MachineReadinessWaiter
+
+# Each phase is measured from the first timeline field to the second. Phases
+# ending at checks_passing_at are only reported for machines passed to
+# ProvisioningProfiler.record_ready().
+FLY_PROFILER_PHASES = {
+    "create_to_launch": ("created_at", "launched_at"),
+    "launch_to_start": ("launched_at", "started_at"),
+    "start_to_checks_passing": ("started_at", "checks_passing_at"),
+    "create_to_start": ("created_at", "started_at"),
+    "create_to_checks_passing": ("created_at", "checks_passing_at"),
+}
+
+FLY_PROFILER_DIMENSIONS = [
+    "region",
+    "image",
+    "guest",
+]
+
+
+def build_timeline(
+    machine: FlyMachine,
+    events: list[FlyMachineEvent],
+    checks_passing_at: datetime | None = None,
+) -> FlyMachineTimeline:
+    """
+    Reconstructs a machine's provisioning timeline from its events.
+
+    Events don't record health check transitions, and a check's updated_at moves
+    whenever it is re-run, so when checks started passing has to be observed
+    separately, e.g. by a MachineReadinessWaiter.
+
+    Args:
+        checks_passing_at (datetime): When the machine was first seen ready.
+            Defaults to None.
+    """
+    launched_at = None
+    started_at = None
+
+    # The events endpoint returns the newest event first.
+    for event in sorted(events, key=lambda event: event.timestamp):
+        if event.type == "launch" and launched_at is None:
+            launched_at = event.timestamp
+        elif event.type == "start" and event.status == "started":
+            started_at = started_at or event.timestamp
+
+    guest = machine.config.size
+    if machine.config.guest is not None:
+        guest = (
+            f"{machine.config.guest.cpu_kind}-{machine.config.guest.cpus}x"
+            f"-{machine.config.guest.memory_mb}mb"
+        )
+
+    return FlyMachineTimeline(
+        machine_id=machine.id,
+        region=machine.region,
+        image=machine.config.image,
+        guest=guest,
+        created_at=machine.created_at or launched_at,
+        launched_at=launched_at,
+        started_at=started_at,
+        checks_passing_at=checks_passing_at,
+    )
+
+
+def _percentile(ordered: list[float], percentile: float) -> float:
+    return ordered[min(int(len(ordered) * percentile), len(ordered) - 1)]
+
+
+def _summarize(durations: list[float]) -> dict:
+    ordered = sorted(durations)
+    return {
+        "count": len(ordered),
+        "mean": statistics.fmean(ordered),
+        "p50": _percentile(ordered, 0.5),
+        "p90": _percentile(ordered, 0.9),
+        "p99": _percentile(ordered, 0.99),
+        "max": ordered[-1],
+    }
+
+
+class ProvisioningProfiler:
+    """
+    Measures where time goes between creating a Fly machine and it passing its checks.
+
+    collect() builds a FlyMachineTimeline per machine from its events,
+    record_ready() adds when each machine passed its checks from a
+    MachineReadinessWaiter, and report() summarizes the latency of each
+    provisioning phase by region, image and guest size.
+    """
+
+    def __init__(
+        self,
+        app: "App",
+        concurrency: int = DEFAULT_API_CONCURRENCY,
+    ):
+        self.app = app
+        self.concurrency = concurrency
+        self.timelines: dict[str, FlyMachineTimeline] = {}
+        self.ready_at: dict[str, datetime] = {}
+
+    async def collect(
+        self,
+        machine_ids: list[str] | None = None,
+    ) -> list[FlyMachineTimeline]:
+        """
+        Fetches events for machines and adds their timelines to the profiler.
+
+        Args:
+            machine_ids (list[str]): The machines to profile. Defaults to every
+                machine in the app.
+        """
+        machines = await self.app.list_machines()
+        if machine_ids is not None:
+            machines = [machine for machine in machines if machine.id in machine_ids]
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def _collect(machine: FlyMachine) -> FlyMachineTimeline | None:
+            async with semaphore:
+                try:
+                    events = await self.app.Machine(machine.id).get_events()
+                except (FlyError, httpx.HTTPError) as e:
+                    logging.warning("Unable to get events for %s: %s", machine.id, e)
+                    return None
+            return build_timeline(machine, events, self.ready_at.get(machine.id))
+
+        timelines = [
+            timeline
+            for timeline in await asyncio.gather(*[_collect(m) for m in machines])
+            if timeline is not None
+        ]
+
+        for timeline in timelines:
+            self.timelines[timeline.machine_id] = timeline
+
+        return timelines
+
+    def record_ready(
+        self,
+        waiter: "MachineReadinessWaiter",
+    ) -> None:
+        """
+        Records when each machine tracked by a MachineReadinessWaiter passed its checks.
+
+        Can be called before or after collect(); timelines collected later pick
+        up the recorded times too.
+        """
+        self.ready_at.update(waiter.ready_at)
+
+        for machine_id, ready_at in waiter.ready_at.items():
+            if machine_id in self.timelines:
+                self.timelines[machine_id].checks_passing_at = ready_at
+
+    def report(
+        self,
+    ) -> dict:
+        """
+        Returns latency statistics in seconds for each phase, overall and by dimension.
+
+        The result looks like {"all": {phase: stats}, "region": {"ams": {phase: stats}}, ...}.
+        Machines that never reached a phase are left out of that phase's statistics.
+        """
+        durations: dict[str, dict[str, dict[str, list[float]]]] = defaultdict(
+            lambda: defaultdict(lambda: defaultdict(list))
+        )
+
+        for timeline in self.timelines.values():
+            for phase, (start_field, end_field) in FLY_PROFILER_PHASES.items():
+                start = getattr(timeline, start_field)
+                end = getattr(timeline, end_field)
+                if start is None or end is None:
+                    continue
+
+                duration = (end - start).total_seconds()
+                durations["all"]["all"][phase].append(duration)
+                for dimension in FLY_PROFILER_DIMENSIONS:
+                    group = getattr(timeline, dimension) or "unknown"
+                    durations[dimension][group][phase].append(duration)
+
+        report = {
+            dimension: {
+                group: {
+                    phase: _summarize(values) for phase, values in phases.items()
+                }
+                for group, phases in groups.items()
+            }
+            for dimension, groups in durations.items()
+        }
+        report["all"] = report.get("all", {}).get("all", {})
+
+        return report
+
+    def to_json(
+        self,
+    ) -> str:
+        """Returns the timelines and report as JSON, for tracking over time."""
+        return json.dumps(
+            {
+                "app_name": self.app.app_name,
+                "generated_at": datetime.now(timezone.utc).isoformat(),
+                "timelines": [
+                    timeline.model_dump(mode="json")
+                    for timeline in self.timelines.values()
+                ],
+                "report": self.report(),
+            },
+            indent=2,
+        )
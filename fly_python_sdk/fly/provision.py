@@ -0,0 +1,275 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable
+
+from fly_python_sdk import DEFAULT_API_CONCURRENCY, FLY_MACHINE_DEFAULT_WAIT_TIMEOUT
+from fly_python_sdk.exceptions import FlyError
+from fly_python_sdk.fly.app import App
+from fly_python_sdk.fly.org import Org
+from fly_python_sdk.models.machine import FlyMachine
+from fly_python_sdk.models.volume import FlyVolume
+
+
+class _ProvisioningNode:
+    def __init__(
+        self,
+        create: Callable[[dict[str, Any]], Awaitable[Any]],
+        depends_on: list[str],
+        rollback: Callable[[Any], Awaitable[None]] | None,
+        wait: Callable[[Any], Awaitable[None]] | None,
+    ):
+        self.create = create
+        self.depends_on = depends_on
+        self.rollback = rollback
+        self.wait = wait
+
+
+class Provisioner:
+    """
+    Provisions apps, volumes and machines as a dependency graph.
+
+    Each resource is added with the keys of the resources it depends on. run()
+    starts every resource as soon as its dependencies are ready, running
+    independent resources concurrently. If anything fails, every resource that
+    was created is rolled back, dependents first.
+    """
+
+    def __init__(
+        self,
+        org: Org,
+        concurrency: int = DEFAULT_API_CONCURRENCY,
+    ):
+        self.org = org
+        self.concurrency = concurrency
+        self._nodes: dict[str, _ProvisioningNode] = {}
+
+    def add(
+        self,
+        key: str,
+        create: Callable[[dict[str, Any]], Awaitable[Any]],
+        depends_on: list[str] = [],
+        rollback: Callable[[Any], Awaitable[None]] | None = None,
+        wait: Callable[[Any], Awaitable[None]] | None = None,
+    ) -> str:
+        """
+        Adds a resource to the graph.
+
+        Args:
+            key (str): A unique key for the resource.
+            create (Callable): Creates the resource. It is passed the results of
+                every resource created so far, keyed by resource key.
+            depends_on (list[str]): Keys of resources that must be created first.
+            rollback (Callable): Undoes create, given its result. Defaults to None.
+            wait (Callable): Waits until the created resource is usable, given its
+                result. The resource is rolled back if this fails. Defaults to None.
+        """
+        if key in self._nodes:
+            raise FlyError(message=f"{key} has already been added.")
+
+        self._nodes[key] = _ProvisioningNode(
+            create, list(depends_on), rollback, wait
+        )
+
+        return key
+
+    def add_app(
+        self,
+        key: str,
+        app_name: str,
+        network: str = "default",
+        depends_on: list[str] = [],
+    ) -> str:
+        """Adds a Fly app. Its result is an App."""
+
+        async def _create(results: dict[str, Any]) -> App:
+            await self.org.create_app(app_name, network=network)
+            return self.org.App(app_name)
+
+        async def _rollback(app: App) -> None:
+            await app.delete()
+
+        return self.add(key, _create, depends_on=depends_on, rollback=_rollback)
+
+    def add_volume(
+        self,
+        key: str,
+        app_name: str,
+        name: str,
+        region: str,
+        size_gb: int = 1,
+        depends_on: list[str] = [],
+    ) -> str:
+        """Adds a volume. Its result is a FlyVolume."""
+
+        async def _create(results: dict[str, Any]) -> FlyVolume:
+            return await self.org.App(app_name).create_volume(
+                name, region, size_gb=size_gb
+            )
+
+        async def _rollback(volume: FlyVolume) -> None:
+            await self.org.App(app_name).Volume(volume.id).delete()
+
+        return self.add(key, _create, depends_on=depends_on, rollback=_rollback)
+
+    def add_machine(
+        self,
+        key: str,
+        app_name: str,
+        machine: FlyMachine | Callable[[dict[str, Any]], FlyMachine],
+        depends_on: list[str] = [],
+        wait: bool = False,
+        wait_timeout: int = FLY_MACHINE_DEFAULT_WAIT_TIMEOUT,
+    ) -> str:
+        """
+        Adds a machine. Its result is a FlyMachine.
+
+        Args:
+            machine (FlyMachine | Callable): The machine to create, or a function that
+                builds it from the results of its dependencies, e.g. to mount a volume.
+            wait (bool): If True, dependents wait until the machine has started.
+        """
+
+        async def _create(results: dict[str, Any]) -> FlyMachine:
+            new_machine = (
+                machine if isinstance(machine, FlyMachine) else machine(results)
+            )
+            return await self.org.App(app_name).create_machine(new_machine)
+
+        async def _wait(created_machine: FlyMachine) -> None:
+            app = self.org.App(app_name)
+            await app.Machine(created_machine.id).wait("started", timeout=wait_timeout)
+
+        async def _rollback(created_machine: FlyMachine) -> None:
+            app = self.org.App(app_name)
+            await app.Machine(created_machine.id).destroy(force=True)
+
+        return self.add(
+            key,
+            _create,
+            depends_on=depends_on,
+            rollback=_rollback,
+            wait=_wait if wait is True else None,
+        )
+
+    async def run(
+        self,
+    ) -> dict[str, Any]:
+        """
+        Creates every resource in the graph and returns their results by key.
+
+        Raises a FlyError after rolling back if any resource could not be created.
+        """
+        self._check_graph()
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        results: dict[str, Any] = {}
+        created: list[str] = []
+        creating: set[str] = set()
+        failed = asyncio.Event()
+        tasks: dict[str, asyncio.Task] = {}
+
+        async def _run_node(key: str) -> None:
+            node = self._nodes[key]
+            for dependency in node.depends_on:
+                # Shielded, so cancelling this node leaves its dependencies running.
+                await asyncio.shield(tasks[dependency])
+
+            async with semaphore:
+                logging.info("Provisioning %s...", key)
+                creating.add(key)
+                try:
+                    results[key] = await node.create(results)
+                finally:
+                    creating.discard(key)
+
+            # Record the resource before waiting on it, so it's rolled back even
+            # if it never becomes ready. Waiting doesn't hold a create slot.
+            created.append(key)
+
+            if node.wait is not None and not failed.is_set():
+                await node.wait(results[key])
+
+        for key in self._nodes:
+            tasks[key] = asyncio.create_task(_run_node(key))
+
+        done, pending = await asyncio.wait(
+            tasks.values(), return_when=asyncio.FIRST_EXCEPTION
+        )
+        errors = [task.exception() for task in done if task.exception() is not None]
+
+        if not errors:
+            return results
+
+        failed.set()
+
+        # Creates that are already in flight may succeed on the server, so let
+        # them finish and be rolled back. Everything else is cancelled.
+        for key, task in tasks.items():
+            if key not in creating:
+                task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        error = errors[0]
+        logging.error("Provisioning failed, rolling back: %s", error)
+        await self._rollback(created, results)
+
+        raise FlyError(
+            message=f"Provisioning failed and was rolled back: {error}"
+        ) from error
+
+    async def _rollback(
+        self,
+        created: list[str],
+        results: dict[str, Any],
+    ) -> None:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        tasks: dict[str, asyncio.Task] = {}
+
+        async def _undo(key: str) -> None:
+            # Undo a resource only after everything that depends on it is gone.
+            await asyncio.gather(
+                *[
+                    tasks[dependent]
+                    for dependent in created
+                    if key in self._nodes[dependent].depends_on
+                ]
+            )
+
+            rollback = self._nodes[key].rollback
+            if rollback is None:
+                return
+
+            async with semaphore:
+                try:
+                    await rollback(results[key])
+                except Exception as e:
+                    logging.error("Unable to roll back %s: %s", key, e)
+
+        for key in created:
+            tasks[key] = asyncio.create_task(_undo(key))
+
+        await asyncio.gather(*tasks.values())
+
+    def _check_graph(
+        self,
+    ) -> None:
+        """Raises a FlyError if a dependency is missing or the graph has a cycle."""
+        visited: set[str] = set()
+        visiting: set[str] = set()
+
+        def _visit(key: str) -> None:
+            if key in visited:
+                return
+            if key in visiting:
+                raise FlyError(message=f"{key} is part of a dependency cycle.")
+
+            visiting.add(key)
+            for dependency in self._nodes[key].depends_on:
+                if dependency not in self._nodes:
+                    raise FlyError(message=f"{key} depends on unknown {dependency}.")
+                _visit(dependency)
+            visiting.discard(key)
+            visited.add(key)
+
+        for key in self._nodes:
+            _visit(key)
@@ -0,0 +1,176 @@
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+
+import httpx
+
+from fly_python_sdk import FLY_MACHINE_DEFAULT_WAIT_TIMEOUT
+from fly_python_sdk.exceptions import FlyError, MachineNotReadyError
+from fly_python_sdk.models.machine import FlyMachine
+
+if TYPE_CHECKING:
+    from fly_python_sdk.fly.app import App
+
+FLY_READINESS_MIN_POLL_INTERVAL = 0.5
+FLY_READINESS_MAX_POLL_INTERVAL = 5.0
+
+FLY_MACHINE_FAILED_STATES = [
+    "destroying",
+    "destroyed",
+]
+
+
+def is_machine_ready(machine: FlyMachine) -> bool:
+    """Returns True if a machine is started and every configured check is passing."""
+    if machine.state != "started":
+        return False
+
+    statuses = {check.name: check.status for check in machine.checks or []}
+
+    return all(
+        statuses.get(name) == "passing" for name in (machine.config.checks or {})
+    )
+
+
+def _describe(machine: FlyMachine | None) -> str:
+    if machine is None:
+        return "not found"
+
+    checks = ", ".join(
+        f"{check.name}={check.status}" for check in machine.checks or []
+    )
+    return f"{machine.state} ({checks})" if checks else f"{machine.state}"
+
+
+class MachineReadinessWaiter:
+    """
+    Tracks many Fly machines until they are ready, using one shared list_machines poll.
+
+    Each machine has a future in `futures` that resolves to its FlyMachine once it is
+    started with all checks passing, or raises a MachineNotReadyError if it fails or
+    is still pending at the deadline. Awaiting the waiter itself returns once every
+    machine has been resolved, with the outcome summarized in `ready`, `failed` and
+    `stragglers`. `ready_at` records when each ready machine was first seen ready,
+    which is accurate to within one poll interval.
+    """
+
+    def __init__(
+        self,
+        app: "App",
+        machine_ids: list[str],
+        timeout: float = FLY_MACHINE_DEFAULT_WAIT_TIMEOUT,
+        min_interval: float = FLY_READINESS_MIN_POLL_INTERVAL,
+        max_interval: float = FLY_READINESS_MAX_POLL_INTERVAL,
+    ):
+        loop = asyncio.get_running_loop()
+
+        self.app = app
+        self.timeout = timeout
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.futures: dict[str, asyncio.Future] = {
+            machine_id: loop.create_future() for machine_id in machine_ids
+        }
+        self.ready: dict[str, FlyMachine] = {}
+        self.ready_at: dict[str, datetime] = {}
+        self.failed: dict[str, str] = {}
+        self.stragglers: dict[str, str] = {}
+
+        for future in self.futures.values():
+            # Callers that only await the waiter shouldn't see "exception never retrieved".
+            future.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+        self._task = asyncio.create_task(self._poll())
+
+    def __await__(self):
+        return self._wait().__await__()
+
+    async def _wait(
+        self,
+    ) -> "MachineReadinessWaiter":
+        await self._task
+        return self
+
+    async def _poll(
+        self,
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        interval = self.min_interval
+        pending = set(self.futures)
+        last_seen: dict[str, str] = {}
+
+        try:
+            while pending:
+                progressed = False
+
+                try:
+                    machines = {
+                        machine.id: machine
+                        for machine in await self.app.list_machines()
+                    }
+                except (FlyError, httpx.HTTPError) as e:
+                    logging.warning(
+                        "Unable to poll machines in %s: %s", self.app.app_name, e
+                    )
+                    machines = {}
+
+                for machine_id in list(pending if machines else []):
+                    machine = machines.get(machine_id)
+                    description = _describe(machine)
+
+                    if machine is not None and is_machine_ready(machine):
+                        self.ready[machine_id] = machine
+                        self.ready_at[machine_id] = datetime.now(timezone.utc)
+                        self.futures[machine_id].set_result(machine)
+                        pending.discard(machine_id)
+                        progressed = True
+                    elif (
+                        machine is not None
+                        and machine.state in FLY_MACHINE_FAILED_STATES
+                    ):
+                        self.failed[machine_id] = description
+                        self.futures[machine_id].set_exception(
+                            MachineNotReadyError(
+                                message=f"{machine_id} in {self.app.app_name} is {description}."
+                            )
+                        )
+                        pending.discard(machine_id)
+                        progressed = True
+                    elif last_seen.get(machine_id) != description:
+                        progressed = True
+
+                    last_seen[machine_id] = description
+
+                remaining = deadline - loop.time()
+                if not pending or remaining <= 0:
+                    break
+
+                # Poll quickly while machines are changing and back off while they aren't.
+                if progressed:
+                    interval = self.min_interval
+                else:
+                    interval = min(interval * 1.5, self.max_interval)
+
+                await asyncio.sleep(min(interval, remaining))
+        finally:
+            # Resolve every remaining future, even if polling was cancelled or failed,
+            # so nobody awaiting one is left hanging.
+            elapsed = self.timeout - (deadline - loop.time())
+            for machine_id in pending:
+                description = last_seen.get(machine_id, "unknown")
+                self.stragglers[machine_id] = description
+                self.futures[machine_id].set_exception(
+                    MachineNotReadyError(
+                        message=f"{machine_id} in {self.app.app_name} was not ready after {elapsed:.0f}s: {description}."
+                    )
+                )
+
+        logging.info(
+            "%d machines ready, %d failed and %d not ready in %s.",
+            len(self.ready),
+            len(self.failed),
+            len(self.stragglers),
+            self.app.app_name,
+        )
@@ -0,0 +1,391 @@
+import asyncio
+import logging
+import sqlite3
+
+import httpx
+
+from fly_python_sdk import DEFAULT_API_CONCURRENCY
+from fly_python_sdk.exceptions import FlyError
+from fly_python_sdk.fly.org import Org
+from fly_python_sdk.models.app import FlyAppOverview
+from fly_python_sdk.models.machine import FlyMachine
+from fly_python_sdk.models.volume import FlyVolume
+
+FLY_STORE_DEFAULT_REFRESH_INTERVAL = 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS apps (
+    org_slug TEXT NOT NULL,
+    name TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (org_slug, name)
+);
+CREATE TABLE IF NOT EXISTS machines (
+    id TEXT PRIMARY KEY,
+    org_slug TEXT NOT NULL,
+    app_name TEXT NOT NULL,
+    region TEXT,
+    state TEXT,
+    updated_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS machines_org_slug_app_name ON machines (org_slug, app_name);
+CREATE INDEX IF NOT EXISTS machines_region ON machines (region);
+CREATE INDEX IF NOT EXISTS machines_state ON machines (state);
+CREATE TABLE IF NOT EXISTS machine_metadata (
+    machine_id TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (machine_id, key)
+);
+CREATE INDEX IF NOT EXISTS machine_metadata_key_value ON machine_metadata (key, value);
+CREATE TABLE IF NOT EXISTS volumes (
+    id TEXT PRIMARY KEY,
+    org_slug TEXT NOT NULL,
+    app_name TEXT NOT NULL,
+    region TEXT,
+    state TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS volumes_org_slug_app_name ON volumes (org_slug, app_name);
+CREATE INDEX IF NOT EXISTS volumes_region ON volumes (region);
+CREATE INDEX IF NOT EXISTS volumes_state ON volumes (state);
+"""
+
+
+class MetadataStore:
+    """
+    A local SQLite store of app, machine and volume records for a Fly.io Organization.
+
+    Records are served from disk immediately and kept current by refresh(),
+    which only rewrites records that have changed since the last refresh.
+    Several organizations can share one database file; every record is kept
+    per organization, so each store only reads and refreshes its own.
+    """
+
+    def __init__(
+        self,
+        org: Org,
+        path: str,
+        refresh_interval: float = FLY_STORE_DEFAULT_REFRESH_INTERVAL,
+        concurrency: int = DEFAULT_API_CONCURRENCY,
+    ):
+        self.org = org
+        self.path = path
+        self.refresh_interval = refresh_interval
+        self.concurrency = concurrency
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+        self._refresh_task: asyncio.Task | None = None
+
+    ###################
+    # Refresh Methods #
+    ###################
+
+    async def refresh(
+        self,
+    ) -> int:
+        """
+        Fetches the latest records from the Fly Machines API and applies any changes.
+
+        Returns the number of records that were inserted, updated or deleted.
+        """
+        apps = await self.org.list_apps()
+        changes = self._apply_apps(apps)
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def _refresh_app(app_name: str) -> int:
+            async with semaphore:
+                app = self.org.App(app_name)
+                try:
+                    machines, volumes = await asyncio.gather(
+                        app.list_machines(),
+                        app.list_volumes(app_name),
+                    )
+                except (FlyError, httpx.HTTPError) as e:
+                    # Keep serving the last known records for this app.
+                    logging.warning("Unable to refresh %s: %s", app_name, e)
+                    return 0
+            return self._apply_machines(app_name, machines) + self._apply_volumes(
+                app_name, volumes
+            )
+
+        results = await asyncio.gather(*[_refresh_app(app.name) for app in apps])
+        changes += sum(results)
+
+        logging.debug("Applied %d changes to %s.", changes, self.path)
+
+        return changes
+
+    async def start(
+        self,
+    ) -> None:
+        """
+        Starts refreshing the store in the background every refresh_interval seconds.
+        """
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(
+        self,
+    ) -> None:
+        """
+        Stops the background refresh started by start().
+        """
+        if self._refresh_task is None:
+            return
+
+        self._refresh_task.cancel()
+        try:
+            await self._refresh_task
+        except asyncio.CancelledError:
+            pass
+        self._refresh_task = None
+
+    def close(
+        self,
+    ) -> None:
+        """
+        Closes the underlying SQLite database.
+        """
+        self._db.close()
+
+    async def _refresh_loop(
+        self,
+    ) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except (FlyError, httpx.HTTPError) as e:
+                logging.warning("Unable to refresh %s: %s", self.path, e)
+            await asyncio.sleep(self.refresh_interval)
+
+    def _apply_apps(
+        self,
+        apps: list[FlyAppOverview],
+    ) -> int:
+        org_slug = self.org.org_slug
+        stored = dict(
+            self._db.execute(
+                "SELECT name, data FROM apps WHERE org_slug = ?", (org_slug,)
+            )
+        )
+        changes = 0
+
+        with self._db:
+            for app in apps:
+                data = app.model_dump_json()
+                if stored.pop(app.name, None) != data:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO apps (org_slug, name, data) "
+                        "VALUES (?, ?, ?)",
+                        (org_slug, app.name, data),
+                    )
+                    changes += 1
+
+            # Anything left over no longer exists in the organization.
+            for app_name in stored:
+                params = (org_slug, app_name)
+                self._db.execute(
+                    "DELETE FROM apps WHERE org_slug = ? AND name = ?", params
+                )
+                self._db.execute(
+                    "DELETE FROM machine_metadata WHERE machine_id IN "
+                    "(SELECT id FROM machines WHERE org_slug = ? AND app_name = ?)",
+                    params,
+                )
+                self._db.execute(
+                    "DELETE FROM machines WHERE org_slug = ? AND app_name = ?", params
+                )
+                self._db.execute(
+                    "DELETE FROM volumes WHERE org_slug = ? AND app_name = ?", params
+                )
+                changes += 1
+
+        return changes
+
+    def _apply_machines(
+        self,
+        app_name: str,
+        machines: list[FlyMachine],
+    ) -> int:
+        stored = dict(
+            self._db.execute(
+                "SELECT id, updated_at FROM machines "
+                "WHERE org_slug = ? AND app_name = ?",
+                (self.org.org_slug, app_name),
+            )
+        )
+        changes = 0
+
+        with self._db:
+            for machine in machines:
+                updated_at = machine.updated_at and machine.updated_at.isoformat()
+                if (
+                    machine.id in stored
+                    and stored.pop(machine.id) == updated_at
+                    and updated_at is not None
+                ):
+                    continue
+
+                self._db.execute(
+                    "INSERT OR REPLACE INTO machines "
+                    "(id, org_slug, app_name, region, state, updated_at, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        machine.id,
+                        self.org.org_slug,
+                        app_name,
+                        machine.region,
+                        machine.state,
+                        updated_at,
+                        machine.model_dump_json(),
+                    ),
+                )
+                self._db.execute(
+                    "DELETE FROM machine_metadata WHERE machine_id = ?", (machine.id,)
+                )
+                self._db.executemany(
+                    "INSERT INTO machine_metadata (machine_id, key, value) "
+                    "VALUES (?, ?, ?)",
+                    [
+                        (machine.id, key, value)
+                        for key, value in (machine.config.metadata or {}).items()
+                    ],
+                )
+                changes += 1
+
+            for machine_id in stored:
+                self._db.execute("DELETE FROM machines WHERE id = ?", (machine_id,))
+                self._db.execute(
+                    "DELETE FROM machine_metadata WHERE machine_id = ?", (machine_id,)
+                )
+                changes += 1
+
+        return changes
+
+    def _apply_volumes(
+        self,
+        app_name: str,
+        volumes: list[FlyVolume],
+    ) -> int:
+        # Volumes have no updated_at, so compare the serialized records instead.
+        stored = dict(
+            self._db.execute(
+                "SELECT id, data FROM volumes WHERE org_slug = ? AND app_name = ?",
+                (self.org.org_slug, app_name),
+            )
+        )
+        changes = 0
+
+        with self._db:
+            for volume in volumes:
+                data = volume.model_dump_json()
+                if stored.pop(volume.id, None) == data:
+                    continue
+
+                self._db.execute(
+                    "INSERT OR REPLACE INTO volumes "
+                    "(id, org_slug, app_name, region, state, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        volume.id,
+                        self.org.org_slug,
+                        app_name,
+                        volume.region,
+                        volume.state,
+                        data,
+                    ),
+                )
+                changes += 1
+
+            for volume_id in stored:
+                self._db.execute("DELETE FROM volumes WHERE id = ?", (volume_id,))
+                changes += 1
+
+        return changes
+
+    #################
+    # Query Methods #
+    #################
+
+    def list_apps(
+        self,
+    ) -> list[FlyAppOverview]:
+        """
+        Returns the stored apps, sorted by name.
+        """
+        rows = self._db.execute(
+            "SELECT data FROM apps WHERE org_slug = ? ORDER BY name",
+            (self.org.org_slug,),
+        )
+        return [FlyAppOverview.model_validate_json(data) for (data,) in rows]
+
+    def list_machines(
+        self,
+        app_name: str | None = None,
+        region: str | None = None,
+        state: str | None = None,
+        metadata: dict[str, str] | None = None,
+    ) -> list[FlyMachine]:
+        """
+        Returns the stored machines that match every given filter.
+
+        Args:
+            app_name (str): Only return machines in this app.
+            region (str): Only return machines in this region.
+            state (str): Only return machines in this state.
+            metadata (dict[str, str]): Only return machines whose config metadata
+                contains all of these key/value pairs.
+        """
+        query = "SELECT data FROM machines WHERE org_slug = ?"
+        params: list[str] = [self.org.org_slug]
+
+        for column, value in (
+            ("app_name", app_name),
+            ("region", region),
+            ("state", state),
+        ):
+            if value is not None:
+                query += f" AND {column} = ?"
+                params.append(value)
+
+        for key, value in (metadata or {}).items():
+            query += (
+                " AND id IN (SELECT machine_id FROM machine_metadata"
+                " WHERE key = ? AND value = ?)"
+            )
+            params.extend([key, value])
+
+        rows = self._db.execute(query + " ORDER BY id", params)
+        return [FlyMachine.model_validate_json(data) for (data,) in rows]
+
+    def list_volumes(
+        self,
+        app_name: str | None = None,
+        region: str | None = None,
+        state: str | None = None,
+    ) -> list[FlyVolume]:
+        """
+        Returns the stored volumes that match every given filter.
+
+        Args:
+            app_name (str): Only return volumes in this app.
+            region (str): Only return volumes in this region.
+            state (str): Only return volumes in this state.
+        """
+        query = "SELECT data FROM volumes WHERE org_slug = ?"
+        params: list[str] = [self.org.org_slug]
+
+        for column, value in (
+            ("app_name", app_name),
+            ("region", region),
+            ("state", state),
+        ):
+            if value is not None:
+                query += f" AND {column} = ?"
+                params.append(value)
+
+        rows = self._db.execute(query + " ORDER BY id", params)
+        return [FlyVolume.model_validate_json(data) for (data,) in rows]
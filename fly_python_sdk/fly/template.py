@@ -0,0 +1,73 @@
+import json
+
+from fly_python_sdk.models.machine import FlyMachineConfig
+
+
+def _encode(value) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+class MachineTemplate:
+    """
+    A machine config that is validated and serialized once, then reused for many machines.
+
+    The config is pre-encoded without its env and metadata. render() only encodes
+    the per-machine name and region and the merged env and metadata, and splices
+    them into the pre-encoded bytes.
+    """
+
+    def __init__(
+        self,
+        config: FlyMachineConfig | dict,
+    ):
+        if not isinstance(config, FlyMachineConfig):
+            config = FlyMachineConfig(**config)
+
+        self.config = config
+        self._config_json = config.model_dump_json(exclude_none=True).encode()
+
+        # "image" is required, so the remaining config is never an empty object.
+        base_json = config.model_dump_json(
+            exclude_none=True, exclude={"env", "metadata"}
+        ).encode()
+        self._base_json = base_json[:-1]
+        self._env = config.env or {}
+        self._metadata = config.metadata or {}
+
+    def render(
+        self,
+        name: str | None = None,
+        region: str | None = None,
+        env: dict[str, str] | None = None,
+        metadata: dict[str, str] | None = None,
+    ) -> bytes:
+        """
+        Returns an encoded machine creation request body.
+
+        Args:
+            name (str): The name of the machine. Defaults to None.
+            region (str): The deployment region for the machine. Defaults to None.
+            env (dict[str, str]): Environment variables merged over the template's.
+            metadata (dict[str, str]): Metadata merged over the template's.
+        """
+        config_json = self._config_json
+
+        if env or metadata:
+            config_json = self._base_json
+            for key, base, values in (
+                (b"env", self._env, env),
+                (b"metadata", self._metadata, metadata),
+            ):
+                if base or values:
+                    merged = {**base, **values} if values else base
+                    config_json += b',"%s":%s' % (key, _encode(merged))
+            config_json += b"}"
+
+        fields = [
+            b'"%s":%s' % (key.encode(), _encode(value))
+            for key, value in (("name", name), ("region", region))
+            if value is not None
+        ]
+        fields.append(b'"config":' + config_json)
+
+        return b"{" + b",".join(fields) + b"}"
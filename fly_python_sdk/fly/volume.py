@@ -1,3 +1,4 @@
+from fly_python_sdk.exceptions import FlyError
 from fly_python_sdk.fly.api import FlyApi
 from fly_python_sdk.models.volume import FlyVolume
 
@@ -12,11 +13,46 @@ class Volume(FlyApi):
         api_token,
         org_slug,
         app_name,
-        machine_id: str,
         volume_id: str,
+        machine_id: str | None = None,
+        **api_options,
     ):
-        super().__init__(api_token)
+        super().__init__(api_token, **api_options)
         self.org_slug = org_slug
         self.app_name = app_name
         self.machine_id = machine_id
         self.volume_id = volume_id
+
+    async def delete(
+        self,
+    ) -> None:
+        """
+        Deletes a Fly volume.
+        """
+        r = await self._make_api_delete_request(
+            f"apps/{self.app_name}/volumes/{self.volume_id}"
+        )
+
+        if r.status_code != 200:
+            raise FlyError(
+                message=f"Unable to delete {self.volume_id} in {self.app_name}!"
+            )
+
+        return
+
+    async def inspect(
+        self,
+    ) -> FlyVolume:
+        """
+        Get information about a Fly volume.
+        """
+        r = await self._make_api_get_request(
+            f"apps/{self.app_name}/volumes/{self.volume_id}"
+        )
+
+        if r.status_code != 200:
+            raise FlyError(
+                message=f"Unable to get {self.volume_id} in {self.app_name}!"
+            )
+
+        return FlyVolume(**r.json())
@@ -120,6 +120,26 @@ class FlyMachineEvent(BaseModel):
     type: str
 
 
+class FlyMachineExecResponse(BaseModel):
+    exit_code: Optional[int] = None
+    exit_signal: Optional[int] = None
+    stdout: Optional[str] = None
+    stderr: Optional[str] = None
+
+
+class FlyMachineExecResult(BaseModel):
+    machine_id: str
+    response: Optional[FlyMachineExecResponse] = None
+    error: Optional[str] = None
+
+
+class FlyMachineCheckStatus(BaseModel):
+    name: str
+    status: str
+    output: Optional[str] = None
+    updated_at: Optional[datetime] = None
+
+
 class FlyMachine(BaseModel):
     id: Optional[str] = None
     name: Optional[str] = None
@@ -129,5 +149,23 @@ class FlyMachine(BaseModel):
     private_ip: Optional[str] = None
     config: FlyMachineConfig
     image_ref: Optional[FlyMachineImageRef] = None
+    checks: Optional[list[FlyMachineCheckStatus]] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+
+
+class FlyMachineChangeEvent(BaseModel):
+    type: str
+    machine: FlyMachine
+    previous: Optional[FlyMachine] = None
+
+
+class FlyMachineTimeline(BaseModel):
+    machine_id: str
+    region: Optional[str] = None
+    image: str
+    guest: Optional[str] = None
+    created_at: Optional[datetime] = None
+    launched_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    checks_passing_at: Optional[datetime] = None
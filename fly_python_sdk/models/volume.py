@@ -1,11 +1,12 @@
 from datetime import datetime
+from typing import Optional
 
 from pydantic import BaseModel
 
 
 class FlyVolume(BaseModel):
-    attached_alloc_id: str
-    attached_machine_id: str
+    attached_alloc_id: Optional[str] = None
+    attached_machine_id: Optional[str] = None
     block_size: int
     blocks: int
     blocks_avail: int
@@ -0,0 +1,37 @@
+import pytest
+
+from fly_python_sdk.fly.app import App
+from fly_python_sdk.fly.informer import MachineInformer
+
+
+@pytest.fixture
+def fake_app():
+    """
+    Returns a factory for Apps whose list_machines returns each snapshot in turn,
+    then the last. Exceptions in the snapshots are raised instead. The number of
+    polls so far is kept in app.list_machines.calls.
+    """
+
+    def _fake_app(*snapshots, app_name="fly-away"):
+        app = App("token", "personal", app_name)
+        calls = []
+
+        async def list_machines():
+            calls.append(None)
+            snapshot = snapshots[min(len(calls), len(snapshots)) - 1]
+            if isinstance(snapshot, Exception):
+                raise snapshot
+            return snapshot
+
+        list_machines.calls = calls
+        app.list_machines = list_machines
+        return app
+
+    return _fake_app
+
+
+@pytest.fixture(autouse=True)
+def reset_informers():
+    """Keeps shared MachineInformers from leaking between tests."""
+    yield
+    MachineInformer._informers.clear()
@@ -0,0 +1,107 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from fly_python_sdk.exceptions import FlyError
+from fly_python_sdk.fly.machine import Machine
+
+SOURCE = {
+    "id": "source",
+    "name": "fly-away",
+    "state": "started",
+    "region": "iad",
+    "config": {"image": "nginx:latest", "env": {"PORT": "80"}},
+}
+
+
+class FakeApi:
+    """Creates clones from POSTed configs, failing any in `failing_regions`."""
+
+    def __init__(self, failing_regions=(), wait_delay=0.0):
+        self.failing_regions = set(failing_regions)
+        self.wait_delay = wait_delay
+        self.requests: list[str] = []
+        self.created: list[dict] = []
+
+    async def handler(self, request):
+        path = request.url.path
+        self.requests.append(f"{request.method} {path}")
+
+        if request.method == "GET" and path.endswith("/machines/source"):
+            return httpx.Response(200, json=SOURCE)
+
+        if request.method == "POST":
+            payload = json.loads(request.content)
+            if payload.get("region") in self.failing_regions:
+                return httpx.Response(422)
+            self.created.append(payload)
+            return httpx.Response(
+                200, json={"id": f"clone-{len(self.created)}", "state": "created", **payload}
+            )
+
+        if path.endswith("/wait"):
+            await asyncio.sleep(self.wait_delay)
+            self.requests.append(f"ready {path}")
+            return httpx.Response(200, json={"ok": True})
+
+        return httpx.Response(404)
+
+    def machine(self):
+        return Machine(
+            "token",
+            "personal",
+            "fly-away",
+            "source",
+            base_url="https://api.machines.dev",
+            client=httpx.AsyncClient(transport=httpx.MockTransport(self.handler)),
+        )
+
+
+def test_clones_across_regions_from_one_inspect():
+    api = FakeApi()
+
+    clones = asyncio.run(
+        api.machine().clone_many(
+            4, regions=["ams", "syd"], name_pattern="{name}-{region}-{index}"
+        )
+    )
+
+    assert api.requests.count("GET /v1/apps/fly-away/machines/source") == 1
+    assert [clone.region for clone in clones] == ["ams", "syd", "ams", "syd"]
+    assert sorted(payload["name"] for payload in api.created) == [
+        "fly-away-ams-0",
+        "fly-away-ams-2",
+        "fly-away-syd-1",
+        "fly-away-syd-3",
+    ]
+    assert all(payload["config"] == SOURCE["config"] for payload in api.created)
+
+
+def test_failed_clones_are_returned_in_place():
+    api = FakeApi(failing_regions=["syd"])
+
+    clones = asyncio.run(api.machine().clone_many(3, regions=["ams", "syd"]))
+
+    assert clones[0].region == "ams"
+    assert isinstance(clones[1], FlyError)
+    assert clones[2].region == "ams"
+
+
+def test_booting_clones_do_not_hold_create_slots():
+    api = FakeApi(wait_delay=0.05)
+
+    clones = asyncio.run(api.machine().clone_many(3, concurrency=1, wait=True))
+
+    assert len(clones) == 3
+    creates = [i for i, r in enumerate(api.requests) if r.startswith("POST")]
+    first_ready = next(i for i, r in enumerate(api.requests) if r.startswith("ready"))
+    assert max(creates) < first_ready
+
+
+def test_clone_raises_when_the_create_fails():
+    api = FakeApi(failing_regions=["iad"])
+
+    with pytest.raises(FlyError, match="422: Unable to clone source"):
+        asyncio.run(api.machine().clone())
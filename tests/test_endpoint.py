@@ -0,0 +1,151 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from fly_python_sdk.fly import endpoint
+from fly_python_sdk.fly.api import FlyApi
+from fly_python_sdk.fly.endpoint import EndpointSelector
+
+INTERNAL_URL = "http://internal.test"
+PUBLIC_URL = "https://public.test"
+
+
+def _selector(**kwargs):
+    """Returns a selector whose probes always succeed, counting them in `probes`."""
+    selector = EndpointSelector(
+        internal_url=INTERNAL_URL, public_url=PUBLIC_URL, prefer_internal=True, **kwargs
+    )
+    selector.probes = 0
+
+    async def probe():
+        selector.probes += 1
+        selector.internal_healthy = True
+        return True
+
+    selector.probe = probe
+    return selector
+
+
+def _api(handler, **api_options):
+    return FlyApi(
+        "token",
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        **api_options,
+    )
+
+
+def _unreachable_internal(requests):
+    def handler(request):
+        requests.append(request.url.host)
+        if request.url.host == "internal.test":
+            raise httpx.ConnectError("unreachable", request=request)
+        return httpx.Response(200, json={})
+
+    return handler
+
+
+def test_falls_back_to_public_when_internal_is_unreachable():
+    requests = []
+    selector = _selector()
+    api = _api(_unreachable_internal(requests), endpoint_selector=selector)
+
+    r = asyncio.run(api._make_api_get_request("apps"))
+
+    assert r.status_code == 200
+    assert requests == ["internal.test", "public.test"]
+    assert selector.internal_healthy is False
+    assert selector.base_url == PUBLIC_URL
+    assert "unreachable" in selector.last_error
+
+
+def test_does_not_fall_back_when_base_url_is_set():
+    requests = []
+    api = _api(
+        _unreachable_internal(requests),
+        base_url=INTERNAL_URL,
+        endpoint_selector=_selector(),
+    )
+
+    with pytest.raises(httpx.ConnectError):
+        asyncio.run(api._make_api_get_request("apps"))
+
+    assert requests == ["internal.test"]
+
+
+def test_reprobes_after_probe_interval(monkeypatch):
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(endpoint, "time", SimpleNamespace(monotonic=lambda: clock.now))
+    selector = _selector(probe_interval=300)
+
+    async def main():
+        results = [await selector.resolve()]
+        selector.report_failure(OSError("unreachable"))
+
+        clock.now += 299
+        results.append(await selector.resolve())
+        clock.now += 1
+        results.append(await selector.resolve())
+        return results
+
+    assert asyncio.run(main()) == [INTERNAL_URL, PUBLIC_URL, INTERNAL_URL]
+    assert selector.probes == 2
+
+
+def test_probe_checks_the_internal_endpoint_accepts_connections():
+    async def main():
+        server = await asyncio.start_server(
+            lambda reader, writer: writer.close(), "127.0.0.1", 0
+        )
+        port = server.sockets[0].getsockname()[1]
+        selector = EndpointSelector(
+            internal_url=f"http://127.0.0.1:{port}", prefer_internal=True
+        )
+        reachable = await selector.probe()
+
+        server.close()
+        await server.wait_closed()
+        unreachable = await selector.probe()
+        return reachable, unreachable, selector
+
+    reachable, unreachable, selector = asyncio.run(main())
+
+    assert (reachable, unreachable) == (True, False)
+    assert selector.internal_healthy is False
+
+
+@pytest.mark.parametrize("machine_id, prefer_internal", [("1781", True), (None, False)])
+def test_prefers_internal_on_fly(monkeypatch, machine_id, prefer_internal):
+    monkeypatch.delenv("FLY_ALLOC_ID", raising=False)
+    if machine_id is None:
+        monkeypatch.delenv("FLY_MACHINE_ID", raising=False)
+    else:
+        monkeypatch.setenv("FLY_MACHINE_ID", machine_id)
+
+    selector = EndpointSelector(internal_url=INTERNAL_URL, public_url=PUBLIC_URL)
+
+    assert selector.prefer_internal is prefer_internal
+
+
+def test_endpoint_status():
+    selector = _selector()
+    api = _api(lambda request: httpx.Response(200), endpoint_selector=selector)
+
+    assert _api(None, base_url=PUBLIC_URL).endpoint_status == {"base_url": PUBLIC_URL}
+
+    asyncio.run(selector.resolve())
+    status = api.endpoint_status
+
+    assert set(status) == {
+        "base_url",
+        "internal_url",
+        "public_url",
+        "prefer_internal",
+        "internal_healthy",
+        "seconds_since_probe",
+        "last_error",
+    }
+    assert status["base_url"] == INTERNAL_URL
+    assert status["internal_healthy"] is True
+    assert 0 <= status["seconds_since_probe"] < 1
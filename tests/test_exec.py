@@ -0,0 +1,128 @@
+import asyncio
+import json
+
+import httpx
+
+from fly_python_sdk.fly.app import App
+from fly_python_sdk.fly.machine import Machine
+
+
+class FakeApi:
+    """Serves a machine list and runs exec requests, tracking how many are in flight."""
+
+    def __init__(self, states, failing=(), delays={}):
+        self.states = states
+        self.failing = set(failing)
+        self.delays = delays
+        self.bodies: dict[str, dict] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.cancelled: list[str] = []
+
+    async def handler(self, request):
+        segments = request.url.path.strip("/").split("/")
+
+        if segments[-1] == "machines":
+            machines = [
+                {"id": machine_id, "state": state, "config": {"image": "nginx:latest"}}
+                for machine_id, state in self.states.items()
+            ]
+            return httpx.Response(200, json=machines)
+
+        machine_id = segments[-2]
+        self.bodies[machine_id] = json.loads(request.content)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        try:
+            await asyncio.sleep(self.delays.get(machine_id, 0.01))
+        except asyncio.CancelledError:
+            self.cancelled.append(machine_id)
+            raise
+        finally:
+            self.in_flight -= 1
+
+        if machine_id in self.failing:
+            return httpx.Response(500)
+        return httpx.Response(200, json={"exit_code": 0, "stdout": machine_id})
+
+    def app(self):
+        return App(
+            "token",
+            "personal",
+            "fly-away",
+            base_url="https://api.machines.dev",
+            client=httpx.AsyncClient(transport=httpx.MockTransport(self.handler)),
+        )
+
+
+async def _collect(results):
+    return [result async for result in results]
+
+
+def test_exec_sends_the_split_command_and_timeout():
+    api = FakeApi({})
+    machine = Machine(
+        "token",
+        "personal",
+        "fly-away",
+        "m1",
+        base_url="https://api.machines.dev",
+        client=httpx.AsyncClient(transport=httpx.MockTransport(api.handler)),
+    )
+
+    response = asyncio.run(machine.exec("echo 'hello world'", timeout=5))
+
+    assert response.stdout == "m1"
+    assert api.bodies["m1"] == {"command": ["echo", "hello world"], "timeout": 5}
+
+
+def test_exec_all_only_runs_on_started_machines_by_default():
+    api = FakeApi({"a": "started", "b": "stopped", "c": "started"})
+
+    results = asyncio.run(_collect(api.app().exec_all(["uptime"])))
+
+    assert sorted(result.machine_id for result in results) == ["a", "c"]
+    assert sorted(api.bodies) == ["a", "c"]
+
+
+def test_exec_all_limits_concurrency():
+    api = FakeApi({f"m{index}": "started" for index in range(6)})
+
+    results = asyncio.run(_collect(api.app().exec_all("uptime", concurrency=2)))
+
+    assert len(results) == 6
+    assert api.max_in_flight == 2
+
+
+def test_exec_all_reports_failures_and_keeps_going():
+    api = FakeApi({"a": "started", "b": "started", "c": "started"}, failing=["b"])
+
+    results = {
+        result.machine_id: result
+        for result in asyncio.run(_collect(api.app().exec_all("uptime")))
+    }
+
+    assert "500" in results["b"].error and results["b"].response is None
+    assert results["a"].response.stdout == "a"
+    assert results["c"].response.stdout == "c"
+
+
+def test_exec_all_cancels_remaining_commands_when_closed_early():
+    api = FakeApi(
+        {"fast": "started", "slow": "started", "slower": "started"},
+        delays={"fast": 0.01, "slow": 10, "slower": 10},
+    )
+
+    async def main():
+        results = api.app().exec_all("uptime")
+        async for result in results:
+            break
+        await results.aclose()
+        await asyncio.sleep(0)
+        return result
+
+    first = asyncio.run(main())
+
+    assert first.machine_id == "fast"
+    assert sorted(api.cancelled) == ["slow", "slower"]
@@ -0,0 +1,125 @@
+import asyncio
+
+import pytest
+
+from fly_python_sdk.fly.hedge import HedgePolicy, _route
+
+
+class FakeSend:
+    """Returns a new request each call, taking `delays[n]` seconds for the nth call."""
+
+    def __init__(self, *delays, errors=()):
+        self.delays = list(delays)
+        self.errors = list(errors)
+        self.calls = 0
+        self.futures = []
+
+    def __call__(self):
+        index = self.calls
+        self.calls += 1
+        future = asyncio.ensure_future(self._send(index))
+        self.futures.append(future)
+        return future
+
+    async def _send(self, index):
+        await asyncio.sleep(self.delays[index])
+        if index < len(self.errors) and self.errors[index] is not None:
+            raise self.errors[index]
+        return index
+
+
+def test_route():
+    assert _route("apps/fly-away/machines/123/events") == "apps/{}/machines/{}/events"
+    assert _route("apps?org_slug=personal") == "apps"
+
+
+def test_no_hedge_under_threshold():
+    policy = HedgePolicy(initial_delay=1.0, budget=1.0)
+    send = FakeSend(0)
+
+    assert asyncio.run(policy.run("r", send)) == 0
+    assert send.calls == 1
+    assert policy.stats == {
+        "requests": 1,
+        "hedges": 0,
+        "hedge_wins": 0,
+        "budget_exhausted": 0,
+    }
+
+
+def test_hedge_wins_and_primary_is_cancelled():
+    policy = HedgePolicy(initial_delay=0.01, budget=1.0)
+    send = FakeSend(10, 0)
+
+    async def main():
+        result = await policy.run("r", send)
+        await asyncio.sleep(0)
+        return result
+
+    assert asyncio.run(main()) == 1
+    assert send.futures[0].cancelled()
+    assert policy.hedges == 1
+    assert policy.hedge_wins == 1
+
+
+def test_budget_exhausted():
+    policy = HedgePolicy(initial_delay=0.01, budget=0.5)
+    send = FakeSend(0.05, 0.05, 0)
+
+    async def main():
+        # 1 hedge would be more than half of 1 request, but not of 2.
+        first = await policy.run("r", send)
+        second = await policy.run("r", send)
+        return first, second
+
+    assert asyncio.run(main()) == (0, 2)
+    assert send.calls == 3
+    assert policy.budget_exhausted == 1
+    assert policy.hedges == 1
+    assert policy.hedge_wins == 1
+
+
+def test_both_requests_fail_raises_primary_error():
+    policy = HedgePolicy(initial_delay=0.01, budget=1.0)
+    send = FakeSend(
+        0.05, 0, errors=[ValueError("primary"), ValueError("hedge")]
+    )
+
+    with pytest.raises(ValueError, match="primary"):
+        asyncio.run(policy.run("r", send))
+
+    assert policy.hedges == 1
+    assert policy.hedge_wins == 0
+
+
+def test_primary_success_after_hedge_failure():
+    policy = HedgePolicy(initial_delay=0.01, budget=1.0)
+    send = FakeSend(0.05, 0, errors=[None, ValueError("hedge")])
+
+    assert asyncio.run(policy.run("r", send)) == 0
+    assert policy.hedge_wins == 0
+
+
+def test_cancelling_run_cancels_requests():
+    policy = HedgePolicy(initial_delay=0.01, budget=1.0)
+    send = FakeSend(10, 10)
+
+    async def main():
+        task = asyncio.ensure_future(policy.run("r", send))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0)
+
+    asyncio.run(main())
+    assert send.calls == 2
+    assert all(future.cancelled() for future in send.futures)
+
+
+def test_delay_uses_observed_percentile():
+    policy = HedgePolicy(percentile=0.95, min_samples=20, initial_delay=1.0)
+    assert policy.delay("r") == 1.0
+
+    policy._latencies["r"].extend(i / 100 for i in range(100))
+    assert policy.delay("r") == 0.95
@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+
+from fly_python_sdk.exceptions import FlyError
+from fly_python_sdk.fly.app import App
+from fly_python_sdk.models.machine import FlyMachine
+
+
+def _machine(machine_id, state, region="ams"):
+    return FlyMachine(
+        id=machine_id, state=state, region=region, config={"image": "nginx:latest"}
+    )
+
+
+def test_sync_publishes_changes_and_indexes_machines(fake_app):
+    app = fake_app(
+        [_machine("a", "starting"), _machine("b", "started", "iad")],
+        [_machine("a", "started"), _machine("c", "started")],
+    )
+    informer = app.Informer()
+
+    async def main():
+        first = await informer.sync()
+        second = await informer.sync()
+        await informer.stop()
+        return first, second
+
+    first, second = asyncio.run(main())
+
+    assert [(e.type, e.machine.id) for e in first] == [("added", "a"), ("added", "b")]
+    assert [(e.type, e.machine.id) for e in second] == [
+        ("updated", "a"),
+        ("added", "c"),
+        ("removed", "b"),
+    ]
+    assert second[0].previous.state == "starting"
+    assert [m.id for m in informer.list_machines(region="ams", state="started")] == [
+        "a",
+        "c",
+    ]
+    assert informer.list_machines(region="iad") == []
+
+
+def test_informer_is_shared_per_app(fake_app):
+    app = fake_app([])
+    informer = app.Informer(interval=1)
+
+    assert App("token", "other-org", "fly-away").Informer() is informer
+    assert app.Informer(interval=1) is informer
+    with pytest.raises(FlyError, match="already polls every 1s"):
+        app.Informer(interval=2)
+
+    asyncio.run(informer.stop())
+
+    # Stopping unregisters the informer, so the next one can use a new App.
+    assert app.Informer(interval=2) is not informer
+
+
+def test_stop_ends_subscriptions(fake_app):
+    app = fake_app([_machine("a", "started")])
+    informer = app.Informer(interval=0.01)
+
+    async def main():
+        events = []
+
+        async def consume():
+            async for event in informer.subscribe():
+                events.append(event.machine.id)
+
+        consumer = asyncio.create_task(consume())
+        await informer.wait_synced()
+        await informer.stop()
+        await asyncio.wait_for(consumer, 1)
+        return events
+
+    assert asyncio.run(main()) == ["a"]
+
+
+def test_poll_loop_survives_unexpected_errors(fake_app):
+    app = fake_app(ValueError("bad machine"), [_machine("a", "started")])
+    informer = app.Informer(interval=0.01)
+
+    async def main():
+        await informer.start()
+        await asyncio.wait_for(informer.wait_synced(), 1)
+        await informer.stop()
+
+    asyncio.run(main())
+
+    assert len(app.list_machines.calls) >= 2
+    assert informer.get("a") is not None
@@ -0,0 +1,38 @@
+import asyncio
+import hashlib
+import logging
+import os
+from time import time
+
+import pytest
+
+from fly_python_sdk.fly import Fly
+
+dotenv = pytest.importorskip("dotenv")
+dotenv.load_dotenv()
+
+if "FLY_API_TOKEN" not in os.environ or "FLY_TEST_ORG_NAME" not in os.environ:
+    pytest.skip(
+        "FLY_API_TOKEN and FLY_TEST_ORG_NAME are required for live API tests.",
+        allow_module_level=True,
+    )
+
+logging.getLogger().setLevel(logging.DEBUG)
+
+FLY_API_TOKEN = os.environ["FLY_API_TOKEN"]
+FLY_TEST_APP_NAME = hashlib.md5(str(time()).encode()).hexdigest()
+FLY_TEST_ORG_NAME = os.environ["FLY_TEST_ORG_NAME"]
+
+
+def test_get_apps():
+    apps = asyncio.run(Fly(FLY_API_TOKEN).Org(FLY_TEST_ORG_NAME).list_apps())
+    print(apps)
+
+
+def test_create_app():
+    app = asyncio.run(Fly(FLY_API_TOKEN).Org(FLY_TEST_ORG_NAME).create_app(FLY_TEST_APP_NAME))  # fmt: skip
+    assert app is None
+
+
+def test_delete_app():
+    asyncio.run(Fly(FLY_API_TOKEN).Org(FLY_TEST_ORG_NAME).App(FLY_TEST_APP_NAME).delete())  # fmt: skip
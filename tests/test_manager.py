@@ -0,0 +1,167 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from fly_python_sdk.fly.api import DEFAULT_RETRY_AFTER, _parse_retry_after
+from fly_python_sdk.fly.manager import FairScheduler, FlyClientManager, RateLimiter
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_fair_scheduler_hands_off_round_robin():
+    async def main():
+        scheduler = FairScheduler(max_concurrency=1)
+        order = []
+
+        async def request(tenant, index):
+            await scheduler.acquire(tenant)
+            order.append(f"{tenant}{index}")
+
+        await scheduler.acquire("a")
+        tasks = [asyncio.create_task(request("a", i)) for i in range(3)]
+        await _settle()
+        tasks.append(asyncio.create_task(request("b", 0)))
+        await _settle()
+
+        for _ in range(4):
+            scheduler.release()
+            await _settle()
+
+        await asyncio.gather(*tasks)
+        return order, scheduler.available
+
+    order, available = asyncio.run(main())
+
+    # b queued behind three requests from a, but gets the second freed slot.
+    assert order == ["a0", "b0", "a1", "a2"]
+    assert available == 0
+
+
+def test_fair_scheduler_skips_cancelled_waiters():
+    async def main():
+        scheduler = FairScheduler(max_concurrency=1)
+        await scheduler.acquire("a")
+
+        cancelled = asyncio.create_task(scheduler.acquire("b"))
+        waiting = asyncio.create_task(scheduler.acquire("c"))
+        await _settle()
+
+        cancelled.cancel()
+        await _settle()
+        assert "b" not in scheduler._waiters
+
+        scheduler.release()
+        await _settle()
+        assert waiting.done()
+
+        scheduler.release()
+        return scheduler.available
+
+    assert asyncio.run(main()) == 1
+
+
+def test_fair_scheduler_passes_on_slot_cancelled_after_handoff():
+    async def main():
+        scheduler = FairScheduler(max_concurrency=1)
+        await scheduler.acquire("a")
+
+        first = asyncio.create_task(scheduler.acquire("b"))
+        second = asyncio.create_task(scheduler.acquire("c"))
+        await _settle()
+
+        # Hand the slot to b and cancel it before it resumes.
+        scheduler.release()
+        first.cancel()
+        await _settle()
+
+        assert first.cancelled()
+        assert second.done() and not second.cancelled()
+
+    asyncio.run(main())
+
+
+def test_rate_limiter_refills_tokens():
+    async def main():
+        loop = asyncio.get_running_loop()
+        limiter = RateLimiter("a", FairScheduler(), rate=20, burst=2)
+
+        started_at = loop.time()
+        for _ in range(2):
+            async with limiter:
+                pass
+        burst_elapsed = loop.time() - started_at
+
+        async with limiter:
+            pass
+        refill_elapsed = loop.time() - started_at
+
+        return burst_elapsed, refill_elapsed
+
+    burst_elapsed, refill_elapsed = asyncio.run(main())
+
+    assert burst_elapsed < 0.03
+    assert refill_elapsed >= 0.045
+
+
+def test_rate_limiter_throttle_pauses_requests():
+    async def main():
+        loop = asyncio.get_running_loop()
+        limiter = RateLimiter("a", FairScheduler(), rate=1000, burst=10)
+
+        limiter.throttle(0.1)
+        started_at = loop.time()
+        async with limiter:
+            pass
+        return loop.time() - started_at
+
+    assert asyncio.run(main()) >= 0.095
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (None, DEFAULT_RETRY_AFTER),
+        ("5", 5.0),
+        ("1.5", 1.5),
+        ("soon", DEFAULT_RETRY_AFTER),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0),
+    ],
+)
+def test_parse_retry_after(value, expected):
+    assert _parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_future_http_date():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+    assert 25 < _parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 30
+
+
+def test_429_with_http_date_throttles_token():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+    def handler(request):
+        return httpx.Response(
+            429, headers={"Retry-After": format_datetime(retry_at, usegmt=True)}
+        )
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        async with FlyClientManager() as manager:
+            manager.add_org("personal", "token")
+            manager._clients["token"]._transport = httpx.MockTransport(handler)
+            org = manager.Org("personal")
+
+            r = await org._make_api_get_request("apps")
+            return r.status_code, org.rate_limiter._throttled_until - loop.time()
+
+    status_code, throttled_for = asyncio.run(main())
+
+    assert status_code == 429
+    assert 25 < throttled_for <= 30
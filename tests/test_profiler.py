@@ -0,0 +1,108 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import httpx
+
+from fly_python_sdk.fly.app import App
+
+from fly_python_sdk.fly.profiler import ProvisioningProfiler, build_timeline
+from fly_python_sdk.models.machine import FlyMachine, FlyMachineEvent
+
+CREATED_AT = datetime(2023, 7, 1, tzinfo=timezone.utc)
+
+
+def _machine(machine_id):
+    return FlyMachine(
+        id=machine_id,
+        state="started",
+        region="iad",
+        created_at=CREATED_AT,
+        config={
+            "image": "nginx:latest",
+            "checks": {"http": {"port": 80, "interval": "1s", "timeout": "1s"}},
+        },
+        # Checks re-run long after the machine started.
+        checks=[
+            {
+                "name": "http",
+                "status": "passing",
+                "updated_at": CREATED_AT + timedelta(days=3),
+            }
+        ],
+    )
+
+
+def _events(launch_after, start_after):
+    events = [
+        ("launch", "created", launch_after),
+        ("start", "started", start_after),
+        ("start", "started", start_after + 600),
+    ]
+    return [
+        FlyMachineEvent(
+            id=f"{index}",
+            source="flyd",
+            status=status,
+            timestamp=CREATED_AT + timedelta(seconds=seconds),
+            type=event_type,
+        )
+        for index, (event_type, status, seconds) in reversed(list(enumerate(events)))
+    ]
+
+
+def test_builds_timeline_without_check_transitions():
+    timeline = build_timeline(_machine("a"), _events(1, 3))
+
+    assert timeline.launched_at == CREATED_AT + timedelta(seconds=1)
+    assert timeline.started_at == CREATED_AT + timedelta(seconds=3)
+    assert timeline.checks_passing_at is None
+
+
+def test_reports_only_phases_with_observed_timestamps():
+    profiler = ProvisioningProfiler(app=None)
+    for machine_id, launch_after in [("a", 1), ("b", 2)]:
+        timeline = build_timeline(_machine(machine_id), _events(launch_after, 5))
+        profiler.timelines[machine_id] = timeline
+
+    report = profiler.report()
+
+    assert sorted(report["all"]) == ["create_to_launch", "create_to_start", "launch_to_start"]
+    assert report["all"]["create_to_start"]["p50"] == 5
+    assert report["region"]["iad"]["create_to_launch"]["max"] == 2
+
+    profiler.record_ready(
+        SimpleNamespace(ready_at={"a": CREATED_AT + timedelta(seconds=8)})
+    )
+
+    assert profiler.report()["all"]["create_to_checks_passing"]["count"] == 1
+
+
+def test_records_checks_passing_from_a_readiness_waiter():
+    machine = _machine("a").model_dump(mode="json")
+    events = [event.model_dump(mode="json") for event in _events(1, 3)]
+
+    def handler(request):
+        if request.url.path.endswith("/events"):
+            return httpx.Response(200, json=events)
+        return httpx.Response(200, json=[machine])
+
+    app = App(
+        "token",
+        "personal",
+        "fly-away",
+        base_url="https://api.machines.dev",
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    async def main():
+        profiler = ProvisioningProfiler(app)
+        waiter = await app.wait_ready(["a"], timeout=1)
+        profiler.record_ready(waiter)
+        await profiler.collect()
+        return profiler, waiter
+
+    profiler, waiter = asyncio.run(main())
+
+    assert profiler.timelines["a"].checks_passing_at == waiter.ready_at["a"]
+    assert profiler.report()["all"]["start_to_checks_passing"]["count"] == 1
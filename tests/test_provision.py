@@ -0,0 +1,185 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from fly_python_sdk.exceptions import FlyError
+from fly_python_sdk.fly.org import Org
+from fly_python_sdk.fly.provision import Provisioner
+from fly_python_sdk.models.machine import FlyMachine
+
+
+def _provisioner(handler=None):
+    transport = httpx.MockTransport(handler or (lambda request: httpx.Response(500)))
+    org = Org(
+        "token",
+        "personal",
+        base_url="https://api.machines.dev",
+        client=httpx.AsyncClient(transport=transport),
+    )
+    return Provisioner(org)
+
+
+def _resource(log, key, delay=0.0, error=None):
+    """Returns create and rollback functions that record what they did in `log`."""
+
+    async def create(results):
+        log.append(f"create {key} after {sorted(results)}")
+        await asyncio.sleep(delay)
+        if error is not None:
+            raise error
+        return key
+
+    async def rollback(result):
+        log.append(f"rollback {result}")
+
+    return create, rollback
+
+
+def test_creates_dependencies_first():
+    log = []
+    provisioner = _provisioner()
+
+    for key, depends_on in [("machine", ["app", "volume"]), ("volume", ["app"]), ("app", [])]:
+        create, rollback = _resource(log, key)
+        provisioner.add(key, create, depends_on=depends_on, rollback=rollback)
+
+    results = asyncio.run(provisioner.run())
+
+    assert results == {"app": "app", "volume": "volume", "machine": "machine"}
+    assert log == [
+        "create app after []",
+        "create volume after ['app']",
+        "create machine after ['app', 'volume']",
+    ]
+
+
+def test_rejects_cycles_and_unknown_dependencies():
+    provisioner = _provisioner()
+    create, _ = _resource([], "a")
+    provisioner.add("a", create, depends_on=["b"])
+    provisioner.add("b", create, depends_on=["a"])
+
+    with pytest.raises(FlyError, match="dependency cycle"):
+        asyncio.run(provisioner.run())
+
+    provisioner = _provisioner()
+    provisioner.add("a", create, depends_on=["missing"])
+
+    with pytest.raises(FlyError, match="a depends on unknown missing"):
+        asyncio.run(provisioner.run())
+
+
+def test_rolls_back_dependents_first():
+    log = []
+    provisioner = _provisioner()
+
+    for key, depends_on in [("app", []), ("volume", ["app"]), ("ip", ["app"])]:
+        create, rollback = _resource(log, key)
+        provisioner.add(key, create, depends_on=depends_on, rollback=rollback)
+
+    create, rollback = _resource(log, "machine", error=FlyError(message="no capacity"))
+    provisioner.add("machine", create, depends_on=["volume"], rollback=rollback)
+
+    with pytest.raises(FlyError, match="no capacity"):
+        asyncio.run(provisioner.run())
+
+    rollbacks = [entry for entry in log if entry.startswith("rollback")]
+    assert sorted(rollbacks[:2]) == ["rollback ip", "rollback volume"]
+    assert rollbacks[2:] == ["rollback app"]
+
+
+def test_lets_in_flight_creates_finish_before_rolling_back():
+    log = []
+    provisioner = _provisioner()
+
+    create, rollback = _resource(log, "slow", delay=0.05)
+    provisioner.add("slow", create, rollback=rollback)
+    create, rollback = _resource(log, "failing", error=FlyError(message="boom"))
+    provisioner.add("failing", create, rollback=rollback)
+    create, rollback = _resource(log, "blocked")
+    provisioner.add("blocked", create, depends_on=["slow"], rollback=rollback)
+
+    with pytest.raises(FlyError, match="boom"):
+        asyncio.run(provisioner.run())
+
+    assert "rollback slow" in log
+    assert not any("blocked" in entry for entry in log)
+
+
+def test_waits_do_not_hold_create_slots():
+    log = []
+    provisioner = _provisioner()
+    provisioner.concurrency = 1
+
+    async def wait(result):
+        log.append(f"wait {result}")
+        await asyncio.sleep(0.05)
+        log.append(f"ready {result}")
+
+    for key in ["a", "b"]:
+        create, rollback = _resource(log, key)
+        provisioner.add(key, create, rollback=rollback, wait=wait)
+
+    asyncio.run(provisioner.run())
+
+    # b is created while a is still booting.
+    assert log.index("create b after ['a']") < log.index("ready a")
+
+
+def test_skips_waiting_on_in_flight_creates_after_a_failure():
+    log = []
+    provisioner = _provisioner()
+
+    async def wait(result):
+        log.append(f"wait {result}")
+        await asyncio.sleep(10)
+
+    create, rollback = _resource(log, "slow", delay=0.05)
+    provisioner.add("slow", create, rollback=rollback, wait=wait)
+    create, rollback = _resource(log, "failing", error=FlyError(message="boom"))
+    provisioner.add("failing", create, rollback=rollback)
+
+    with pytest.raises(FlyError, match="boom"):
+        asyncio.run(asyncio.wait_for(provisioner.run(), timeout=1))
+
+    assert "wait slow" not in log
+    assert "rollback slow" in log
+
+
+def test_destroys_machines_that_fail_to_start():
+    requests = []
+
+    def handler(request):
+        requests.append(f"{request.method} {request.url.path}")
+
+        if request.url.path == "/v1/apps":
+            return httpx.Response(201, json={})
+        if request.method == "POST":
+            payload = json.loads(request.content)
+            return httpx.Response(200, json={"id": "m1", **payload})
+        if request.url.path.endswith("/wait"):
+            return httpx.Response(408)
+        return httpx.Response(200 if "machines" in request.url.path else 202)
+
+    provisioner = _provisioner(handler)
+    provisioner.add_app("app", "fly-away")
+    provisioner.add_machine(
+        "machine",
+        "fly-away",
+        FlyMachine(region="iad", config={"image": "nginx:latest"}),
+        depends_on=["app"],
+        wait=True,
+    )
+
+    with pytest.raises(FlyError, match="did not reach the started state"):
+        asyncio.run(provisioner.run())
+
+    assert requests == [
+        "POST /v1/apps",
+        "POST /v1/apps/fly-away/machines",
+        "GET /v1/apps/fly-away/machines/m1/wait",
+        "DELETE /v1/apps/fly-away/machines/m1",
+        "DELETE /v1/apps/fly-away",
+    ]
@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+
+from fly_python_sdk.exceptions import MachineNotReadyError
+from fly_python_sdk.models.machine import FlyMachine
+
+CONFIG = {
+    "image": "nginx:latest",
+    "checks": {"http": {"port": 80, "interval": "1s", "timeout": "1s", "path": "/"}},
+}
+
+
+def _machine(machine_id, state, check_status=None):
+    checks = [{"name": "http", "status": check_status}] if check_status else None
+    return FlyMachine(id=machine_id, state=state, config=CONFIG, checks=checks)
+
+
+def test_resolves_ready_failed_and_stragglers(fake_app):
+    app = fake_app(
+        [_machine("a", "starting"), _machine("b", "destroyed"), _machine("c", "created")],
+        [_machine("a", "started", "critical"), _machine("c", "created")],
+        [_machine("a", "started", "passing"), _machine("c", "created")],
+    )
+
+    async def main():
+        waiter = app.wait_ready(["a", "b", "c"], timeout=0.2)
+        waiter.min_interval = 0.01
+        await waiter
+        return waiter
+
+    waiter = asyncio.run(main())
+
+    assert waiter.futures["a"].result().id == "a"
+    assert list(waiter.ready) == ["a"]
+    assert waiter.failed == {"b": "destroyed"}
+    assert waiter.stragglers == {"c": "created"}
+    with pytest.raises(MachineNotReadyError):
+        waiter.futures["c"].result()
+
+
+def test_futures_resolve_when_polling_is_cancelled(fake_app):
+    app = fake_app([_machine("a", "starting")])
+
+    async def main():
+        waiter = app.wait_ready(["a"], timeout=10)
+        await asyncio.sleep(0.05)
+        waiter._task.cancel()
+        with pytest.raises(MachineNotReadyError):
+            await asyncio.wait_for(waiter.futures["a"], 1)
+
+    asyncio.run(main())
+
+
+def test_futures_resolve_when_polling_raises(fake_app):
+    app = fake_app(ValueError("unexpected"))
+
+    async def main():
+        waiter = app.wait_ready(["a"], timeout=10)
+        with pytest.raises(MachineNotReadyError):
+            await asyncio.wait_for(waiter.futures["a"], 1)
+        with pytest.raises(ValueError):
+            await waiter
+
+    asyncio.run(main())
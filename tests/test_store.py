@@ -0,0 +1,181 @@
+import asyncio
+
+import httpx
+
+from fly_python_sdk.fly.org import Org
+from fly_python_sdk.fly.store import MetadataStore
+
+
+def _machine(machine_id, updated_at="2023-07-01T00:00:00Z", region="iad", **metadata):
+    return {
+        "id": machine_id,
+        "state": "started",
+        "region": region,
+        "config": {"image": "nginx:latest", "metadata": metadata or None},
+        "updated_at": updated_at,
+    }
+
+
+def _volume(volume_id, state="created"):
+    return {
+        "id": volume_id,
+        "name": "data",
+        "region": "iad",
+        "size_gb": 1,
+        "state": state,
+        "zone": "a1b2",
+        "block_size": 4096,
+        "blocks": 256,
+        "blocks_avail": 256,
+        "blocks_free": 256,
+        "created_at": "2023-07-01T00:00:00Z",
+        "encrypted": True,
+        "fstype": "ext4",
+    }
+
+
+class FakeApi:
+    """Serves apps, machines and volumes per organization from plain dicts."""
+
+    def __init__(self):
+        self.apps: dict[str, list[str]] = {}
+        self.machines: dict[str, list[dict]] = {}
+        self.volumes: dict[str, list[dict]] = {}
+        self.failing: set[str] = set()
+        self.requests: list[str] = []
+
+    def handler(self, request):
+        self.requests.append(request.url.path)
+        segments = request.url.path.strip("/").split("/")[1:]
+
+        if segments == ["apps"]:
+            org_slug = request.url.params["org_slug"]
+            apps = [
+                {"name": name, "machine_count": 0, "network": "default"}
+                for name in self.apps.get(org_slug, [])
+            ]
+            return httpx.Response(200, json={"apps": apps})
+
+        app_name, resource = segments[1], segments[2]
+        if app_name in self.failing:
+            return httpx.Response(500)
+        return httpx.Response(200, json=getattr(self, resource).get(app_name, []))
+
+    def store(self, path, org_slug="personal"):
+        org = Org(
+            "token",
+            org_slug,
+            base_url="https://api.machines.dev",
+            client=httpx.AsyncClient(transport=httpx.MockTransport(self.handler)),
+        )
+        return MetadataStore(org, path=path)
+
+
+def _ids(records):
+    return [record.id for record in records]
+
+
+def test_only_rewrites_changed_machines(tmp_path):
+    api = FakeApi()
+    api.apps["personal"] = ["fly-away"]
+    api.machines["fly-away"] = [_machine("a"), _machine("b")]
+    store = api.store(str(tmp_path / "fly.db"))
+
+    assert asyncio.run(store.refresh()) == 3
+    assert asyncio.run(store.refresh()) == 0
+
+    api.machines["fly-away"] = [
+        _machine("a"),
+        _machine("b", updated_at="2023-07-01T00:01:00Z", region="ams"),
+    ]
+
+    assert asyncio.run(store.refresh()) == 1
+    assert _ids(store.list_machines(region="ams")) == ["b"]
+
+
+def test_deletes_records_that_are_gone(tmp_path):
+    api = FakeApi()
+    api.apps["personal"] = ["fly-away", "fly-home"]
+    api.machines["fly-away"] = [_machine("a"), _machine("b", role="db")]
+    api.volumes["fly-away"] = [_volume("vol_a"), _volume("vol_b")]
+    api.machines["fly-home"] = [_machine("c", role="db")]
+    store = api.store(str(tmp_path / "fly.db"))
+    asyncio.run(store.refresh())
+
+    api.apps["personal"] = ["fly-away"]
+    api.machines["fly-away"] = [_machine("a")]
+    api.volumes["fly-away"] = [_volume("vol_a")]
+
+    assert asyncio.run(store.refresh()) == 3
+    assert [app.name for app in store.list_apps()] == ["fly-away"]
+    assert _ids(store.list_machines()) == ["a"]
+    assert _ids(store.list_volumes()) == ["vol_a"]
+    assert store.list_machines(metadata={"role": "db"}) == []
+
+
+def test_filters_machines_by_metadata(tmp_path):
+    api = FakeApi()
+    api.apps["personal"] = ["fly-away"]
+    api.machines["fly-away"] = [
+        _machine("a", role="web", tier="free"),
+        _machine("b", role="web", tier="paid"),
+        _machine("c", role="db", tier="paid"),
+    ]
+    store = api.store(str(tmp_path / "fly.db"))
+    asyncio.run(store.refresh())
+
+    assert _ids(store.list_machines(metadata={"role": "web"})) == ["a", "b"]
+    assert _ids(store.list_machines(metadata={"role": "web", "tier": "paid"})) == ["b"]
+    assert store.list_machines(app_name="fly-home", metadata={"role": "web"}) == []
+
+
+def test_keeps_records_when_an_app_cannot_be_listed(tmp_path):
+    api = FakeApi()
+    api.apps["personal"] = ["fly-away"]
+    api.machines["fly-away"] = [_machine("a")]
+    store = api.store(str(tmp_path / "fly.db"))
+    asyncio.run(store.refresh())
+
+    api.machines["fly-away"] = []
+    api.failing.add("fly-away")
+
+    assert asyncio.run(store.refresh()) == 0
+    assert _ids(store.list_machines()) == ["a"]
+
+
+def test_reopened_store_serves_records_without_the_api(tmp_path):
+    path = str(tmp_path / "fly.db")
+    api = FakeApi()
+    api.apps["personal"] = ["fly-away"]
+    api.machines["fly-away"] = [_machine("a", role="web")]
+    api.volumes["fly-away"] = [_volume("vol_a")]
+    store = api.store(path)
+    asyncio.run(store.refresh())
+    store.close()
+
+    offline = FakeApi()
+    reopened = offline.store(path)
+
+    assert [app.name for app in reopened.list_apps()] == ["fly-away"]
+    assert _ids(reopened.list_machines(metadata={"role": "web"})) == ["a"]
+    assert _ids(reopened.list_volumes(app_name="fly-away")) == ["vol_a"]
+    assert offline.requests == []
+
+
+def test_orgs_sharing_a_file_keep_their_own_records(tmp_path):
+    path = str(tmp_path / "fly.db")
+    api = FakeApi()
+    api.apps["a"] = ["app1"]
+    api.apps["b"] = ["app2"]
+    api.machines["app1"] = [_machine("m1", role="web")]
+    api.machines["app2"] = [_machine("m2", role="web")]
+    store_a = api.store(path, org_slug="a")
+    store_b = api.store(path, org_slug="b")
+
+    asyncio.run(store_a.refresh())
+    asyncio.run(store_b.refresh())
+
+    assert [app.name for app in store_a.list_apps()] == ["app1"]
+    assert _ids(store_a.list_machines(metadata={"role": "web"})) == ["m1"]
+    assert [app.name for app in store_b.list_apps()] == ["app2"]
+    assert _ids(store_b.list_machines()) == ["m2"]
@@ -0,0 +1,52 @@
+import json
+
+from fly_python_sdk.fly.template import MachineTemplate
+from fly_python_sdk.models.machine import FlyMachineConfig
+
+CONFIG = {
+    "image": "nginx:latest",
+    "env": {"A": "1", "B": "2"},
+    "metadata": {"role": "web"},
+    "guest": {"cpu_kind": "shared"},
+}
+
+
+def _expected(config, **fields):
+    return {
+        **fields,
+        "config": FlyMachineConfig(**config).model_dump(mode="json", exclude_none=True),
+    }
+
+
+def test_render_without_overrides():
+    body = MachineTemplate(CONFIG).render(name="web-0", region="ams")
+
+    assert json.loads(body) == _expected(CONFIG, name="web-0", region="ams")
+
+
+def test_render_merges_env_and_metadata():
+    body = MachineTemplate(CONFIG).render(
+        region="iad", env={"B": "3", "C": "4"}, metadata={"shard": "1"}
+    )
+
+    assert json.loads(body) == _expected(
+        {
+            **CONFIG,
+            "env": {"A": "1", "B": "3", "C": "4"},
+            "metadata": {"role": "web", "shard": "1"},
+        },
+        region="iad",
+    )
+
+
+def test_render_adds_env_to_config_without_env():
+    body = MachineTemplate({"image": "nginx:latest"}).render(env={"A": "1"})
+
+    assert json.loads(body) == {"config": {"image": "nginx:latest", "env": {"A": "1"}}}
+
+
+def test_render_does_not_mutate_template():
+    template = MachineTemplate(CONFIG)
+    template.render(env={"A": "changed"})
+
+    assert json.loads(template.render())["config"]["env"] == CONFIG["env"]